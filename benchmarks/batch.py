@@ -0,0 +1,77 @@
+"""
+Time Mistaker.mistake_batch against one chaos() call per value
+
+    python benchmarks/batch.py [values]
+
+with mistaker and NumPy installed (pip install -e ".[fast]").
+
+Both paths get fresh streams for the same (seed, row) keys and must give the
+same strings, so the comparison is only of speed.
+"""
+
+import random
+import sys
+import time
+from mistaker import Date, Number
+from mistaker.rng import stream
+
+SEED = 1
+
+
+def numbers(count):
+    rand = random.Random(SEED)
+    return [f"{rand.randint(0, 10**9 - 1):09d}" for _ in range(count)]
+
+
+def dates(count):
+    rand = random.Random(SEED)
+    return [
+        f"{rand.randint(1900, 2030)}-{rand.randint(1, 12):02d}-{rand.randint(1, 28):02d}"
+        for _ in range(count)
+    ]
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def first(pair):
+    return pair[0]
+
+
+def compare(mistaker, values, repeat=3):
+    rand = random.Random(SEED)
+    counts = [rand.randint(1, 6) for _ in values]
+
+    def streams():
+        return [stream(SEED, row) for row in range(len(values))]
+
+    def scalar():
+        return [
+            mistaker(value, rand=rand).chaos(count)
+            for value, rand, count in zip(values, streams(), counts)
+        ]
+
+    def batch():
+        return mistaker.mistake_batch(values, streams(), counts)
+
+    scalar_time, expected = min((timed(scalar) for _ in range(repeat)), key=first)
+    batch_time, result = min((timed(batch) for _ in range(repeat)), key=first)
+    assert result == expected, f"{mistaker.__name__} batch differs from scalar"
+    print(
+        f"{mistaker.__name__:<8} {len(values)} values: "
+        f"scalar {scalar_time:.3f} s, batch {batch_time:.3f} s "
+        f"({scalar_time / batch_time:.1f}x)"
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    compare(Number, numbers(count))
+    compare(Date, dates(count))
+
+
+if __name__ == "__main__":
+    main()
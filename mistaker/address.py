@@ -1,9 +1,10 @@
 from typing import Optional, Dict, Tuple
-from collections import OrderedDict
 import usaddress
+from .alias import AliasTable
 from .word import Word
 from .number import Number
 from .base import BaseMistaker
+from .cache import LRUCache, CacheInfo
 from .constants import ErrorType
 import re
 import random
@@ -604,12 +605,60 @@ class Address(BaseMistaker):
         "#",
     ]
 
-    def __init__(self, text: str = ""):
+    # usaddress.parse results keyed on whitespace-normalized text. Replace
+    # with a differently sized LRUCache to tune memory use.
+    parse_cache = LRUCache(maxsize=8192)
+
+    # usaddress labels -> component names
+    TAG_MAPPING = {
+        "BuildingName": "building_name",
+        "AddressNumber": "street_number",
+        "StreetNamePreDirectional": "street_direction",
+        "StreetName": "street_name",
+        "StreetNamePostType": "street_type",
+        "OccupancyType": "unit_type",
+        "OccupancyIdentifier": "unit_id",
+        "PlaceName": "city",
+        "StateName": "state",
+        "ZipCode": "zip",
+    }
+
+    # Components reported in upper case by parse()
+    UPPERCASE_PARTS = frozenset(
+        [
+            "building_name",
+            "street_direction",
+            "street_name",
+            "street_type",
+            "unit_type",
+            "city",
+            "state",
+        ]
+    )
+
+    # Components mistake() considers, in the order it draws for them
+    MISTAKE_PARTS = (
+        "street_number",
+        "street_direction",
+        "street_name",
+        "street_type",
+        "unit_type",
+        "unit_id",
+        "city",
+        "state",
+        "zip",
+    )
+
+    def __init__(
+        self,
+        text: str = "",
+        rand: Optional[random.Random] = None,
+        error_table: Optional[AliasTable] = None,
+    ):
         if text is None:
             text = ""
         self.text = str(text).strip()
-        self.word_mistaker = Word()
-        super().__init__(self.text)
+        super().__init__(self.text, rand, error_table)
 
     def reformat(self, text: str) -> str:
         """Reformat input text to standard format"""
@@ -632,170 +681,238 @@ class Address(BaseMistaker):
             "zip": None,
         }
 
+    def _parse_spans(self) -> Dict[str, Tuple[str, int, int]]:
+        """
+        Tag the address with usaddress, keeping where each component was found.
+
+        Returns a dict of component -> (value, start, end) where value is the
+        component as usaddress.tag would report it and self.text[start:end]
+        is the same component as written. Unparseable addresses give {}.
+        """
+        if not self.text:
+            return {}
+
+        spans = {}
+        cursor = 0
+        last_label = None
+        is_intersection = False
+
+        # Mirrors usaddress.tag, but keeps token offsets into self.text
+        for token, label in self._tag_tokens(self.text):
+            start = self.text.find(token, cursor)
+            if start < 0:
+                return {}
+            cursor = start + len(token)
+
+            if label == "IntersectionSeparator":
+                is_intersection = True
+            if "StreetName" in label and is_intersection:
+                label = "Second" + label
+            label = self.TAG_MAPPING.get(label, label)
+
+            if label == last_label:
+                spans[label][1] = cursor
+                spans[label][2].append(token)
+            elif label not in spans:
+                spans[label] = [start, cursor, [token]]
+            else:  # Repeated label, which usaddress.tag refuses to tag
+                return {}
+            last_label = label
+
+        components = {}
+        for label, (start, end, tokens) in spans.items():
+            while start < end and self.text[start] in " ,;":
+                start += 1
+            while end > start and self.text[end - 1] in " ,;":
+                end -= 1
+            components[label] = (" ".join(tokens).strip(" ,;"), start, end)
+
+        # Special handling for unit with pound sign
+        unit_id = components.get("unit_id")
+        if unit_id and unit_id[0].startswith("# "):
+            value, start, end = unit_id
+            id_start = start + 1
+            while id_start < end and self.text[id_start].isspace():
+                id_start += 1
+            components["unit_type"] = ("#", start, start + 1)
+            components["unit_id"] = (value.replace("# ", ""), id_start, end)
+
+        return components
+
+    @classmethod
+    def _tag_tokens(cls, text: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Return usaddress (token, label) pairs for text, using the parse cache.
+
+        Tokens never contain whitespace, so addresses that differ only in
+        spacing share an entry.
+        """
+        key = " ".join(text.split())
+        return cls.parse_cache.get_or_compute(key, lambda: tuple(usaddress.parse(key)))
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Hit, miss and eviction counts for the shared parse cache"""
+        return cls.parse_cache.info()
+
+    def _clean_components(
+        self, spans: Dict[str, Tuple[str, int, int]]
+    ) -> Dict[str, Tuple[str, int, int]]:
+        """Upper-case the text components of parsed spans"""
+        return {
+            part: (value.upper() if part in self.UPPERCASE_PARTS else value, s, e)
+            for part, (value, s, e) in spans.items()
+        }
+
     def parse(self) -> dict:
         """Parse address into its component parts using usaddress."""
-        if not self.text:
-            return self._empty_components()
-
-        try:
-            tagged_address, _ = usaddress.tag(
-                self.text,
-                tag_mapping={
-                    "BuildingName": "building_name",  # Added this
-                    "AddressNumber": "street_number",
-                    "StreetNamePreDirectional": "street_direction",
-                    "StreetName": "street_name",
-                    "StreetNamePostType": "street_type",
-                    "OccupancyType": "unit_type",
-                    "OccupancyIdentifier": "unit_id",
-                    "PlaceName": "city",
-                    "StateName": "state",
-                    "ZipCode": "zip",
-                },
-            )
-
-            components = self._empty_components()
-            components.update(tagged_address)
-
-            # Clean up the components
-            if components.get("building_name"):
-                components["building_name"] = components["building_name"].upper()
-            if components.get("street_direction"):
-                components["street_direction"] = components["street_direction"].upper()
-            if components.get("street_name"):
-                components["street_name"] = components["street_name"].upper()
-            if components.get("street_type"):
-                components["street_type"] = components["street_type"].upper()
-            if components.get("unit_type"):
-                components["unit_type"] = components["unit_type"].upper()
-            if components.get("city"):
-                components["city"] = components["city"].upper()
-            if components.get("state"):
-                components["state"] = components["state"].upper()
-
-            # Special handling for unit with pound sign
-            if components.get("unit_id") and components["unit_id"].startswith("# "):
-                components["unit_type"] = "#"
-                components["unit_id"] = components["unit_id"].replace("# ", "")
-
-            return components
-
-        except usaddress.RepeatedLabelError:
-            return self._empty_components()
+        components = self._empty_components()
+        for part, (value, _, _) in self._clean_components(self._parse_spans()).items():
+            components[part] = value
+        return components
 
     def mistake(
         self, error_type: Optional[ErrorType] = None, index: Optional[int] = None
     ) -> str:
         """Generate a mistake in the text based on error type"""
+        return self.chaos(1)
+
+    def chaos(self, count: Optional[int] = None) -> str:
+        """
+        Apply several rounds of compounding mistakes to the address
+
+        The address is parsed once. Each round makes a mistake decision for
+        every part, building on the previous round's value, and all the
+        edits are spliced into the text at the end.
+
+        Args:
+            count: Number of rounds to apply. If None, 1-6 are chosen randomly
+
+        Returns:
+            Address text with all the mistakes applied
+        """
+        if count is None:
+            count = self.rand.randint(1, 6)
+
         if self.text is None or not self.text:
             return ""
 
-        # Make mistakes in all parts
-        result = self.text  # Initialize result with original text
-        parts = [
-            "street_number",
-            "street_direction",
-            "street_name",
-            "street_type",
-            "unit_type",
-            "unit_id",
-            "city",
-            "state",
-            "zip",
+        components = self._clean_components(self._parse_spans())
+        values = {
+            part: components[part][0]
+            for part in self.MISTAKE_PARTS
+            if part in components
+        }
+        changed = set()
+
+        for _ in range(count):
+            for part, value in values.items():
+                if not value:  # Dropped in an earlier round
+                    continue
+                replacement = self._part_mistake(part, value)
+                if replacement is not None:
+                    values[part] = replacement
+                    changed.add(part)
+
+        edits = [
+            (components[part][1], components[part][2], part, values[part])
+            for part in changed
         ]
-
-        # Update our temporary text as we go
-        for part in parts:
-            temp_address = Address(result)  # Create new instance with current result
-            result = temp_address.make_mistake(part)
-
-        return result
+        return self._splice(edits)
 
     def make_mistake(self, part: str) -> str:
         """Generate a mistake in the specified address part"""
-        components = self.parse()
+        components = self._clean_components(self._parse_spans())
 
-        if components[part] is None:
+        if components.get(part) is None:
             return self.text
 
+        value, start, end = components[part]
+        replacement = self._part_mistake(part, value)
+        if replacement is None:
+            return self.text
+        return self._splice([(start, end, part, replacement)])
+
+    def _splice(self, edits: list) -> str:
+        """
+        Apply (start, end, part, replacement) edits to self.text.
+
+        An empty replacement drops the component along with the whitespace
+        after it; a dropped state also tidies the commas around it.
+        """
+        text = self.text
+        limit = len(text)
+        for start, end, part, replacement in sorted(edits, reverse=True):
+            end = min(end, limit)
+            if replacement:
+                # Keep words apart when the original had none, e.g. "#505"
+                if (
+                    end < len(text)
+                    and text[end].isalnum()
+                    and replacement[-1].isalnum()
+                ):
+                    replacement += " "
+                text = text[:start] + replacement + text[end:]
+            elif part == "state":
+                text = text[:start].rstrip(" ,") + ", " + text[end:].lstrip(" ,")
+            else:
+                text = text[:start] + text[end:].lstrip()
+            limit = start
+        return text.strip()
+
+    def _part_mistake(self, part: str, value: str) -> Optional[str]:
+        """
+        Choose a mistake for one address component.
+
+        Returns the replacement text, "" to drop the component, or None to
+        leave it as written.
+        """
         if part in ["street_number", "zip"]:
-            mistaken_number = Number.make_mistake(components[part])
-            return self.text.replace(components[part], mistaken_number)
+            return Number.make_mistake(value, rand=self.rand)
 
         if part == "unit_id":
-            match = re.match(r"(\d+)([A-Za-z]*)", components[part])
+            match = re.match(r"(\d+)([A-Za-z]*)", value)
             if match:
                 numeric_part, alpha_part = match.groups()
-                mistaken_number = Number.make_mistake(numeric_part)
-                new_unit_id = mistaken_number + alpha_part
-                return self.text.replace(components[part], new_unit_id)
+                mistaken_number = Number.make_mistake(numeric_part, rand=self.rand)
+                return mistaken_number + alpha_part + value[match.end() :]
+            return None
 
         if part == "street_name":
-            mistaken_name = self.word_mistaker.mistake()
-            return self.text.replace(components[part], mistaken_name)
+            return Word(value, rand=self.rand).mistake()
 
         if part == "street_direction":
-            chance = random.random()
-            orig_direction = components[part]
+            chance = self.rand.random()
 
             if chance < 0.25:  # Skip direction
-                # Case-insensitive removal of direction and surrounding spaces
-                return re.sub(
-                    rf"\s*{orig_direction}\s*", " ", self.text, flags=re.IGNORECASE
-                ).strip()
+                return ""
             elif chance < 0.5:  # Swap direction
-                new_direction = random.choice(
-                    [d for d in self.DIRECTIONAL_REPLACEMENTS if d != orig_direction]
-                )
-                # Case-insensitive replacement
-                return re.sub(
-                    rf"{orig_direction}", new_direction, self.text, flags=re.IGNORECASE
+                return self.rand.choice(
+                    [d for d in self.DIRECTIONAL_REPLACEMENTS if d != value]
                 )
             elif chance < 0.75:  # Word mistake
-                word_mistaker = Word(orig_direction)
-                mistaken_direction = word_mistaker.mistake()
-                # Case-insensitive replacement
-                return re.sub(
-                    rf"{orig_direction}",
-                    mistaken_direction,
-                    self.text,
-                    flags=re.IGNORECASE,
-                )
-            else:  # Remain same
-                return self.text
+                return Word(value, rand=self.rand).mistake()
+            return None  # Remain same
 
         if part == "building_name":
             # Always make mistake for building name
-            word_mistaker = Word(components[part])
-            mistaken_word = word_mistaker.mistake()
-            return re.sub(
-                rf"{components[part]}", mistaken_word, self.text, flags=re.IGNORECASE
-            )
+            return Word(value, rand=self.rand).mistake()
 
         if part == "city":
             # 30% chance of mistake for city
-            if random.random() < 0.3:
-                word_mistaker = Word(components[part])
-                mistaken_word = word_mistaker.mistake()
-                return re.sub(
-                    rf"{components[part]}",
-                    mistaken_word,
-                    self.text,
-                    flags=re.IGNORECASE,
-                )
-            return self.text
+            if self.rand.random() < 0.3:
+                return Word(value, rand=self.rand).mistake()
+            return None
 
         if part == "state":
-            if random.random() < 0.25:
+            if self.rand.random() < 0.25:
                 # Remove state and fix up the surrounding punctuation
-                return re.sub(
-                    r",?\s*" + components[part] + r"\s*,?", ", ", self.text
-                ).strip()
-            return self.text
+                return ""
+            return None
 
         if part == "street_type":
-            chance = random.random()
-            orig_type = components[part].upper()
+            chance = self.rand.random()
+            orig_type = value.upper()
 
             if chance < 0.3:
                 # Find all variations that map to the same abbreviation
@@ -806,22 +923,17 @@ class Address(BaseMistaker):
                     if v == target_abbrev and k != orig_type
                 ]
                 if variations:
-                    new_type = random.choice(variations)
-                    return re.sub(
-                        rf"{components[part]}",
-                        new_type.title(),
-                        self.text,
-                        flags=re.IGNORECASE,
-                    )
+                    return self.rand.choice(variations).title()
             elif chance < 0.6:
                 # Pick a completely different type
-                different_types = set(self.STREET_TYPE_ABBREVIATIONS.values())
+                # dict keeps a stable order, unlike set(), for seeded runs
+                different_types = dict.fromkeys(self.STREET_TYPE_ABBREVIATIONS.values())
                 current_abbrev = self.STREET_TYPE_ABBREVIATIONS.get(
                     orig_type, orig_type
                 )
-                different_types.discard(current_abbrev)
+                different_types.pop(current_abbrev, None)
                 if different_types:
-                    new_abbrev = random.choice(list(different_types))
+                    new_abbrev = self.rand.choice(list(different_types))
                     # Get a random full form that maps to this abbreviation
                     full_forms = [
                         k
@@ -829,18 +941,12 @@ class Address(BaseMistaker):
                         if v == new_abbrev and len(k) > 2
                     ]  # avoid abbreviations
                     if full_forms:
-                        new_type = random.choice(full_forms)
-                        return re.sub(
-                            rf"{components[part]}",
-                            new_type.title(),
-                            self.text,
-                            flags=re.IGNORECASE,
-                        )
-            return self.text
+                        return self.rand.choice(full_forms).title()
+            return None
 
         if part == "unit_type":
-            chance = random.random()
-            orig_type = components[part].upper()
+            chance = self.rand.random()
+            orig_type = value.upper()
 
             if chance < 0.25:  # Random different unit type
                 options = [
@@ -850,29 +956,14 @@ class Address(BaseMistaker):
                     and k != self.UNIT_TYPE_ABBREVIATIONS.get(orig_type)
                 ]
                 if options:
-                    new_type = random.choice(options)
-                    return re.sub(
-                        rf"{components[part]}",
-                        new_type.title(),
-                        self.text,
-                        flags=re.IGNORECASE,
-                    )
+                    return self.rand.choice(options).title()
 
             elif chance < 0.5:  # Forget unit type
-                return re.sub(
-                    rf"{components[part]}\s+", "", self.text, flags=re.IGNORECASE
-                )
+                return ""
 
             elif chance < 0.75:  # Word mistake
-                word_mistaker = Word(components[part])
-                mistaken_type = word_mistaker.mistake()
-                return re.sub(
-                    rf"{components[part]}",
-                    mistaken_type,
-                    self.text,
-                    flags=re.IGNORECASE,
-                )
+                return Word(value, rand=self.rand).mistake()
 
-            return self.text  # Keep original (last 25%)
+            return None  # Keep original (last 25%)
 
-        return self.text
+        return None
@@ -0,0 +1,64 @@
+from typing import Any, Optional, Sequence, Tuple
+import random
+
+
+class AliasTable:
+    """
+    Walker alias table for O(1) weighted sampling from a fixed set of items
+
+    Built once with Vose's method; each draw costs one random() call, a
+    multiply and two list lookups, with no allocation.
+    """
+
+    def __init__(self, items: Sequence[Any], weights: Optional[Sequence[float]] = None):
+        self.items: Tuple[Any, ...] = tuple(items)
+        count = len(self.items)
+        if count == 0:
+            raise ValueError("AliasTable needs at least one item")
+
+        if weights is None:
+            weights = [1.0] * count
+        if len(weights) != count:
+            raise ValueError("AliasTable needs one weight per item")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("AliasTable weights cannot be negative")
+
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+
+        self.weights: Tuple[float, ...] = tuple(weights)
+        scaled = [weight * count / total for weight in weights]
+        self.prob = [1.0] * count
+        self.alias = list(range(count))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Whatever is left over is full up to rounding error
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, rand: random.Random) -> Any:
+        """Draw one item using the given random number generator"""
+        return self.items[self.sample_index(rand)]
+
+    def sample_index(self, rand: random.Random) -> int:
+        """Draw the position of one item, consuming the same draw as sample()"""
+        position = rand.random() * len(self.items)
+        column = int(position)
+        if position - column < self.prob[column]:
+            return column
+        return self.alias[column]
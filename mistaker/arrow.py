@@ -0,0 +1,134 @@
+"""
+Reading and writing Apache Arrow IPC and Parquet data a record batch at a time
+
+pyarrow is optional. Without it ``pa`` is None and only CSV is available.
+"""
+
+from typing import Any, BinaryIO, Iterator, List, Mapping, Sequence, Tuple
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+FORMATS = ("csv", "parquet", "arrow")
+
+# File extension -> format, for input formats not given explicitly
+EXTENSIONS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".arrows": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+
+def require_pyarrow():
+    """Return the pyarrow module, or raise ImportError if it is not installed"""
+    if pa is None:
+        raise ImportError(
+            "Arrow and Parquet support requires pyarrow: pip install mistaker[arrow]"
+        )
+    return pa
+
+
+def detect_format(path: str) -> str:
+    """Format of a file, from its extension; anything unrecognised is CSV"""
+    return EXTENSIONS.get(os.path.splitext(str(path))[1].lower(), "csv")
+
+
+def read_batches(
+    source: Any, fmt: str, batch_size: int
+) -> Tuple["pa.Schema", Iterator["pa.RecordBatch"]]:
+    """
+    Open Parquet or Arrow IPC input and stream its record batches
+
+    Parquet is read batch_size rows at a time. Arrow IPC files are
+    memory-mapped and read a stored batch at a time; IPC streams (including
+    stdin) are read as they arrive.
+
+    Args:
+        source: Path, or a binary file object for IPC streams
+        fmt: "parquet" or "arrow"
+        batch_size: Rows per batch when reading Parquet
+
+    Returns:
+        (schema, batches)
+    """
+    require_pyarrow()
+    if fmt == "parquet":
+        parquet = pq.ParquetFile(source)
+        return parquet.schema_arrow, parquet.iter_batches(batch_size=batch_size)
+
+    if fmt != "arrow":
+        raise ValueError(f"Unknown record batch format: {fmt}")
+
+    if isinstance(source, (str, os.PathLike)):
+        try:
+            reader = pa.ipc.open_file(pa.memory_map(str(source)))
+        except pa.ArrowInvalid:
+            reader = pa.ipc.open_stream(pa.memory_map(str(source)))
+        else:
+            return reader.schema, (
+                reader.get_batch(i) for i in range(reader.num_record_batches)
+            )
+    else:
+        reader = pa.ipc.open_stream(source)
+    return reader.schema, iter(reader)
+
+
+def open_writer(sink: BinaryIO, fmt: str, schema: "pa.Schema"):
+    """
+    Writer with write_batch() and close() that streams batches to sink
+
+    Parquet is written a row group per batch. Arrow is written in the IPC
+    streaming format, which needs no seeking, so it can go to stdout.
+    Closing the writer finishes the output but leaves sink open.
+    """
+    require_pyarrow()
+    sink = pa.PythonFile(sink, mode="w")
+    if fmt == "parquet":
+        return pq.ParquetWriter(sink, schema)
+    if fmt == "arrow":
+        return pa.ipc.new_stream(sink, schema)
+    raise ValueError(f"Unknown record batch format: {fmt}")
+
+
+def as_strings(column: "pa.Array") -> "pa.Array":
+    """A column as strings, casting other types (dates come out as ISO text)"""
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        return column
+    return column.cast(pa.string())
+
+
+def mistaken_schema(schema: "pa.Schema", columns: Mapping[int, Any]) -> "pa.Schema":
+    """schema with the given column positions changed to strings"""
+    for position in columns:
+        schema = schema.set(position, schema.field(position).with_type(pa.string()))
+    return schema
+
+
+def string_schema(fieldnames: Sequence[str]) -> "pa.Schema":
+    """Schema for CSV columns, all of which are strings"""
+    require_pyarrow()
+    return pa.schema([(name, pa.string()) for name in fieldnames])
+
+
+def rows_to_batch(rows: Sequence[Sequence[str]], schema: "pa.Schema"):
+    """Record batch from rows of values laid out like schema"""
+    columns: List[Any] = [list(column) for column in zip(*rows)]
+    if not columns:
+        columns = [[] for _ in schema.names]
+    return pa.RecordBatch.from_arrays(
+        [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+def batch_to_rows(batch: "pa.RecordBatch") -> List[Tuple[Any, ...]]:
+    """Rows of Python values from a record batch, for writing as CSV"""
+    return list(zip(*(column.to_pylist() for column in batch.columns)))
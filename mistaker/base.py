@@ -1,21 +1,50 @@
 from abc import ABC, abstractmethod
 import random
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from .alias import AliasTable
 from .constants import ErrorType
 
 
 class BaseMistaker(ABC):
     """Base class for all mistaker classes"""
 
-    def __init__(self, text: Optional[str] = None):
+    # Error types drawn when mistake() is called without one, and the alias
+    # table they are drawn from. Subclasses that pick errors set both
+    ERROR_TYPES: Tuple[ErrorType, ...] = ()
+    error_table: Optional[AliasTable] = None
+
+    # Whether mistake() output is already in reformat()'s format, letting
+    # chaos() skip reformatting between compounding mistakes
+    MISTAKES_KEEP_FORMAT = False
+
+    def __init__(
+        self,
+        text: Optional[str] = None,
+        rand: Optional[random.Random] = None,
+        error_table: Optional[AliasTable] = None,
+    ):
         self.text = text
-        self.rand = random.Random()
+        self.rand = rand if rand is not None else random.Random()
+        # Last string known to be in reformat()'s format
+        self._formatted: Optional[str] = None
+        # A weighted table for this instance replaces the uniform class default
+        if error_table is not None:
+            self.error_table = error_table
 
     @abstractmethod
     def reformat(self, text: str) -> str:
         """Reformat input text to standard format"""
         pass
 
+    def _reformatted(self) -> str:
+        """
+        Reformat self.text in place, unless it is a string this instance
+        already reformatted or produced as a format-preserving mistake
+        """
+        if self._formatted is None or self.text is not self._formatted:
+            self.text = self._formatted = self.reformat(self.text)
+        return self.text
+
     @abstractmethod
     def mistake(
         self, error_type: Optional[ErrorType] = None, index: Optional[int] = None
@@ -23,7 +52,72 @@ class BaseMistaker(ABC):
         """Generate a mistake in the text"""
         pass
 
+    def chaos(self, count: Optional[int] = None) -> str:
+        """
+        Apply several compounding mistakes to the text
+
+        Args:
+            count: Number of mistakes to apply. If None, 1-6 are chosen randomly
+
+        Returns:
+            Text with each mistake applied on top of the previous one
+        """
+        if count is None:
+            count = self.rand.randint(1, 6)
+
+        original = self.text
+        try:
+            for _ in range(count):
+                self.text = self.mistake()
+                if self.MISTAKES_KEEP_FORMAT:
+                    self._formatted = self.text
+            return self.text
+        finally:
+            self.text = original
+
     @classmethod
-    def make_mistake(cls, text: str) -> str:
+    def make_mistake(cls, text: str, rand: Optional[random.Random] = None) -> str:
         """Class method for one-off mistake generation"""
-        return cls(text).mistake()
+        return cls(text, rand=rand).mistake()
+
+    @classmethod
+    def column_options(cls, values: Sequence[str]) -> Dict[str, Any]:
+        """
+        Keyword arguments for every mistaker of a column, worked out once
+        from a sample of its values. None by default.
+        """
+        return {}
+
+    @classmethod
+    def mistake_batch(
+        cls,
+        values: Sequence[str],
+        rands: Sequence[random.Random],
+        counts: Sequence[int],
+        error_table: Optional[AliasTable] = None,
+        **options: Any,
+    ) -> List[Union[str, Exception]]:
+        """
+        Apply chaos(count) to a column of values, each with its own stream
+
+        Subclasses can override this with a faster whole-column version as long
+        as every value comes out the same as it would one at a time.
+
+        Args:
+            options: Keyword arguments for each mistaker, from column_options()
+
+        Returns:
+            One result per value; a value that could not be mistaken gets the
+            ValueError or AttributeError it raised instead of a string
+        """
+        results = []
+        for value, rand, count in zip(values, rands, counts):
+            try:
+                results.append(
+                    cls(value, rand=rand, error_table=error_table, **options).chaos(
+                        count
+                    )
+                )
+            except (ValueError, AttributeError) as e:
+                results.append(e)
+        return results
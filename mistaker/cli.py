@@ -3,34 +3,259 @@ import csv
 import sys
 import io
 import argparse
-from . import Generator, __version__
+import multiprocessing
+import os
+from contextlib import contextmanager, nullcontext
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from . import Generator, __version__, arrow
+from .pipeline import ThreadedWriter, read_ahead
 
+# Bytes of encoded CSV collected before each write to stdout
+OUTPUT_BUFFER_SIZE = 1 << 20
 
-def process_file(generator: Generator, input_path: str):
-    """Process input CSV file and write results to stdout"""
+
+def read_rows(reader: Iterable[List[str]], width: int) -> Iterator[List[str]]:
+    """
+    Rows from a csv.reader laid out like its header
+
+    Blank lines are skipped and short rows are padded with empty values, as
+    csv.DictReader would. Rows with more values than the header are an error.
+    """
+    for row in reader:
+        if len(row) == width:
+            yield row
+        elif not row:
+            continue
+        elif len(row) < width:
+            yield row + [""] * (width - len(row))
+        else:
+            raise ValueError(
+                f"Line {reader.line_num} has {len(row)} values "
+                f"but the header has {width}"
+            )
+
+
+@contextmanager
+def open_input(input_file: Union[str, Iterable[str]]) -> Iterator[Iterable[str]]:
+    """
+    Open the input CSV for reading
+
+    A path is opened and closed here. "-" reads stdin as a stream, decoding
+    its bytes directly so quoted line breaks survive as they do in files.
+    Anything else (an open text file, or any iterable of lines) is read as
+    given and left open.
+    """
+    if input_file == "-":
+        stdin = io.TextIOWrapper(
+            sys.stdin.buffer,
+            encoding=sys.stdin.encoding,
+            errors=sys.stdin.errors,
+            newline="",
+        )
+        try:
+            yield stdin
+        finally:
+            # Don't close stdin
+            stdin.detach()
+    elif isinstance(input_file, (str, os.PathLike)):
+        with open(input_file, "r", newline="") as infile:
+            yield infile
+    else:
+        yield input_file
+
+
+def csv_chunks(
+    generator: Generator,
+    infile: Iterable[str],
+    workers: int,
+    chunk_size: int,
+    unbuffered: bool,
+) -> Tuple[List[str], Iterator[List[Sequence[str]]]]:
+    """
+    Header and output rows, chunk_size at a time, for CSV input
+
+    Parsing runs on a reader thread, joined to the mistake stage by a
+    bounded queue so memory stays flat. Unbuffered output skips the reader
+    thread and hands over each row as soon as it is made.
+    """
+    reader = csv.reader(infile)
+    fieldnames = next(reader, None)
+    if not fieldnames:
+        raise ValueError("Input CSV file has no headers")
+    rows = read_rows(reader, len(fieldnames))
+
+    if unbuffered:
+        records = generator.generate_rows(
+            rows, fieldnames, workers=workers, chunk_size=chunk_size
+        )
+        return fieldnames, ([record] for record in records)
+
+    # Forking while the reader and writer threads hold locks could deadlock
+    # a worker, so workers come from a fork server where there is one
+    mp_context = None
+    if workers > 1 and "forkserver" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("forkserver")
+    records = generator.generate_rows(
+        chain.from_iterable(read_ahead(rows, chunk_size)),
+        fieldnames,
+        workers=workers,
+        chunk_size=chunk_size,
+        mp_context=mp_context,
+    )
+    return fieldnames, iter(lambda: list(islice(records, chunk_size)), [])
+
+
+def batch_chunks(
+    generator: Generator, input_file: Any, input_format: str, chunk_size: int
+) -> Tuple["arrow.pa.Schema", Iterator["arrow.pa.RecordBatch"]]:
+    """
+    Output schema and record batches for Parquet or Arrow IPC input
+
+    Batches are decoded on a reader thread while the previous one is being
+    mistaken. Columns without mistakes stay in Arrow throughout.
+    """
+    if input_file == "-":
+        if input_format == "parquet":
+            raise ValueError("Parquet input must be a file, not stdin")
+        input_file = sys.stdin.buffer
+    schema, batches = arrow.read_batches(input_file, input_format, chunk_size)
+
+    steps = {step.index: step for step in generator.compile_plan(schema.names).steps}
+    mistaken = (
+        generator.generate_record_batch(batch)
+        for batch in chain.from_iterable(read_ahead(batches, 1))
+    )
+    return arrow.mistaken_schema(schema, steps), mistaken
+
+
+def process_file(
+    generator: Generator,
+    input_file: Union[str, Iterable[str]],
+    workers: int = 1,
+    chunk_size: int = 1000,
+    flush_every: Optional[int] = None,
+    unbuffered: bool = False,
+    input_format: Optional[str] = None,
+    output_format: str = "csv",
+):
+    """
+    Process input CSV file and write results to stdout
+
+    Input is read incrementally, so a stream such as stdin is processed as
+    it arrives and memory use does not grow with its length. Input is parsed
+    on a reader thread and output is encoded on a writer thread, chunk_size
+    rows at a time, while mistakes are made in between. Output goes through
+    a large buffer, so stdout sees a few big writes rather than one per row.
+
+    Parquet and Arrow IPC input and output (which need pyarrow) are streamed
+    a record batch at a time in the same way.
+
+    Args:
+        input_file: Path of the input file, "-" for stdin, or an open text
+            file of CSV (see open_input)
+        flush_every: Flush stdout after at least this many output rows.
+            If None, output is flushed whenever the buffer fills
+        unbuffered: Write and flush each row as soon as it is made, for
+            interactive piping
+        input_format: "csv", "parquet" or "arrow". If None, it is worked out
+            from the file extension, and stdin is read as CSV
+        output_format: "csv", "parquet" or "arrow"
+    """
+    if flush_every is not None and flush_every < 1:
+        raise ValueError("flush_every must be at least 1")
+    if input_format is None:
+        input_format = "csv"
+        if isinstance(input_file, (str, os.PathLike)) and input_file != "-":
+            input_format = arrow.detect_format(input_file)
+    for fmt in (input_format, output_format):
+        if fmt not in arrow.FORMATS:
+            raise ValueError(f"Unknown format: {fmt}")
+    if input_format != "csv" and workers > 1:
+        raise ValueError("Worker processes are only supported for CSV input")
+
+    stdout = sys.stdout.buffer
+    if unbuffered:
+        output_buffer = stdout
+    else:
+        output_buffer = io.BufferedWriter(stdout, buffer_size=OUTPUT_BUFFER_SIZE)
     output_wrapper = io.TextIOWrapper(
-        sys.stdout.buffer, encoding="utf-8", newline="", write_through=True
+        output_buffer, encoding="utf-8", newline="", write_through=unbuffered
     )
 
     try:
-        with open(input_path, "r", newline="") as infile:
-            reader = csv.DictReader(infile)
-            if not reader.fieldnames:
-                raise ValueError("Input CSV file has no headers")
+        # Record batch input is opened by pyarrow
+        opened = open_input(input_file) if input_format == "csv" else nullcontext()
+        with opened as infile:
+            if input_format == "csv":
+                fieldnames, chunks = csv_chunks(
+                    generator, infile, workers, chunk_size, unbuffered
+                )
+                schema = None
+            else:
+                schema, chunks = batch_chunks(
+                    generator, input_file, input_format, chunk_size
+                )
+                fieldnames = schema.names
+
+            if output_format == "csv":
+                writer = csv.writer(output_wrapper)
+                writer.writerow(fieldnames)
 
-            writer = csv.DictWriter(output_wrapper, fieldnames=reader.fieldnames)
-            writer.writeheader()
+                def write_chunk(chunk) -> int:
+                    if not isinstance(chunk, list):
+                        chunk = arrow.batch_to_rows(chunk)
+                    writer.writerows(chunk)
+                    return len(chunk)
 
-            # Process all records through the generator
-            for record in generator.generate_all(reader):
-                writer.writerow(record)
+            else:
+                if schema is None:
+                    schema = arrow.string_schema(fieldnames)
+                batch_writer = arrow.open_writer(output_buffer, output_format, schema)
+
+                def write_chunk(chunk) -> int:
+                    if isinstance(chunk, list):
+                        chunk = arrow.rows_to_batch(chunk, schema)
+                    batch_writer.write_batch(chunk)
+                    return chunk.num_rows
+
+            interval = 1 if unbuffered else flush_every
+            unflushed = 0
+
+            def write(chunk) -> None:
+                nonlocal unflushed
+                unflushed += write_chunk(chunk)
+                if interval is not None and unflushed >= interval:
+                    output_wrapper.flush()
+                    stdout.flush()
+                    unflushed = 0
+
+            if unbuffered:
+                for chunk in chunks:
+                    write(chunk)
+            else:
+                with ThreadedWriter(write) as output:
+                    for chunk in chunks:
+                        output.put(chunk)
+
+            if output_format != "csv":
+                batch_writer.close()
+
+        output_wrapper.flush()
+        stdout.flush()
 
     except BrokenPipeError:
         # Handle case where output is piped to head or similar
         sys.stderr.close()
     finally:
         # Don't close stdout
-        output_wrapper.detach()
+        try:
+            output_wrapper.detach()
+            if output_buffer is not stdout:
+                output_buffer.detach()
+        except BrokenPipeError:
+            # Anything still buffered after a broken pipe has nowhere to go
+            pass
 
 
 def main():
@@ -57,6 +282,53 @@ def main():
     parser.add_argument(
         "--max-chaos", type=int, help="Maximum number of mistakes per field"
     )
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        help="Random seed for reproducible output",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Records sent to each worker at a time (default: 1000)",
+    )
+    parser.add_argument(
+        "--flush-every",
+        type=int,
+        metavar="N",
+        help="Flush output after every N rows (default: when the buffer fills)",
+    )
+    parser.add_argument(
+        "-u",
+        "--unbuffered",
+        action="store_true",
+        help="Write each row as soon as it is made, for interactive piping",
+    )
+    parser.add_argument(
+        "--input-format",
+        choices=arrow.FORMATS,
+        help="Input format (default: from the file extension; CSV for stdin)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=arrow.FORMATS,
+        default="csv",
+        help="Output format (default: csv); parquet and arrow need pyarrow",
+    )
+    parser.add_argument(
+        "--date-table",
+        help="Precomputed date mistake table to memory-map (built if missing)",
+    )
     parser.add_argument(
         "-v", "--version", action="version", version=f"%(prog)s {__version__}"
     )
@@ -76,18 +348,28 @@ def main():
             generator.config["min_chaos"] = args.min_chaos
         if args.max_chaos is not None:
             generator.config["max_chaos"] = args.max_chaos
+        if args.seed is not None:
+            generator.seed = args.seed
+        if args.date_table is not None:
+            generator.config["date_table"] = args.date_table
 
         # Revalidate config after changes
         generator.validate_config()
 
         # Handle stdin or file input
-        if args.input_file == "-":
-            if sys.stdin.isatty():
-                parser.print_help()
-                return 1
-            process_file(generator, sys.stdin)
-        else:
-            process_file(generator, args.input_file)
+        if args.input_file == "-" and sys.stdin.isatty():
+            parser.print_help()
+            return 1
+        process_file(
+            generator,
+            args.input_file,
+            args.workers,
+            args.chunk_size,
+            flush_every=args.flush_every,
+            unbuffered=args.unbuffered,
+            input_format=args.input_format,
+            output_format=args.format,
+        )
 
     except FileNotFoundError as e:
         print(f"Error: Could not find file '{e.filename}'", file=sys.stderr)
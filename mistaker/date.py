@@ -1,9 +1,14 @@
 # mistaker/date.py
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
+import random
 import re
+from . import vectorized
+from .alias import AliasTable
+from .date_table import DateTable
 from .base import BaseMistaker
 from .constants import ErrorType, MISREAD_NUMBERS, TEN_KEYS
+from .rng import Stream
 
 
 class Date(BaseMistaker):
@@ -14,6 +19,148 @@ class Date(BaseMistaker):
         MONTH = 1
         DAY = 2
 
+    ERROR_TYPES = (
+        ErrorType.ONE_DIGIT_UP,
+        ErrorType.ONE_DIGIT_DOWN,
+        ErrorType.KEY_SWAP,
+        ErrorType.ONE_DECADE_DOWN,
+        ErrorType.Y2K,
+        ErrorType.MONTH_DAY_SWAP,
+        ErrorType.MISREAD,
+        ErrorType.NUMERIC_KEY_PAD,
+        ErrorType.DIGIT_SHIFT,
+    )
+    error_table = AliasTable(ERROR_TYPES)
+
+    DATE_PARTS = (DatePart.YEAR, DatePart.MONTH, DatePart.DAY)
+
+    _MM_DD_YYYY = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+    _MM_DD_YY = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{2})$")
+    _YYYY_MM_DD = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+    # Name of the format to try first, usually a column's detect_format()
+    date_format: Optional[str] = None
+
+    # Precomputed outcomes to look mistakes up in instead of working them out
+    date_table: Optional[DateTable] = None
+
+    # Bumped whenever _apply_mistake changes any outcome, so DateTables saved
+    # by older code are rebuilt rather than loaded
+    MISTAKE_VERSION = 1
+
+    # Errors that are cheaper to work out than to look up
+    _DIRECT_ERRORS = frozenset(
+        {
+            ErrorType.ONE_DIGIT_UP,
+            ErrorType.ONE_DIGIT_DOWN,
+            ErrorType.ONE_DECADE_DOWN,
+            ErrorType.MONTH_DAY_SWAP,
+        }
+    )
+
+    def __init__(
+        self,
+        text: Optional[str] = None,
+        rand: Optional[random.Random] = None,
+        error_table: Optional[AliasTable] = None,
+        date_format: Optional[str] = None,
+        date_table: Optional[DateTable] = None,
+    ):
+        super().__init__(text, rand, error_table)
+        if date_format is not None:
+            self.date_format = date_format
+        if date_table is not None:
+            self.date_table = date_table
+        # (reformatted text, (year, month, day)) of the last date parsed or made
+        self._parsed: Optional[Tuple[str, Tuple[int, int, int]]] = None
+
+    @staticmethod
+    def _parse_iso(text: str) -> Optional[Tuple[int, int, int]]:
+        """Parse YYYY-MM-DD by fixed offsets, or return None if it is not one"""
+        if len(text) != 10 or text[4] != "-" or text[7] != "-" or not text.isascii():
+            return None
+        year, month, day = text[0:4], text[5:7], text[8:10]
+        if not (year.isdigit() and month.isdigit() and day.isdigit()):
+            return None
+        return int(year), int(month), int(day)
+
+    @staticmethod
+    def _parse_mdy(text: str) -> Optional[Tuple[int, int, int]]:
+        """Parse M/D/YYYY or M/D/YY, or return None if it is not one"""
+        if not text.isascii():
+            return None
+        parts = text.split("/")
+        if len(parts) != 3:
+            return None
+        month, day, year = parts
+        if not (
+            0 < len(month) <= 2
+            and 0 < len(day) <= 2
+            and len(year) in (2, 4)
+            and month.isdigit()
+            and day.isdigit()
+            and year.isdigit()
+        ):
+            return None
+        # Assume 20xx for two-digit years
+        return int(year) + (2000 if len(year) == 2 else 0), int(month), int(day)
+
+    FORMAT_PARSERS = {"iso": _parse_iso, "mdy": _parse_mdy}
+
+    @classmethod
+    def detect_format(
+        cls, values: Sequence[str], sample_size: int = 100
+    ) -> Optional[str]:
+        """
+        Pick the format that parses the most of a sample of a column's values
+
+        Returns:
+            A key of FORMAT_PARSERS, or None if no sampled value fits any
+        """
+        sample = [value for value in values[:sample_size] if isinstance(value, str)]
+        best, best_count = None, 0
+        for name, parser in cls.FORMAT_PARSERS.items():
+            count = sum(parser(value) is not None for value in sample)
+            if count > best_count:
+                best, best_count = name, count
+        return best
+
+    @classmethod
+    def column_options(cls, values: Sequence[str]) -> Dict[str, Any]:
+        """The column's date format, so every date tries it first"""
+        date_format = cls.detect_format(values)
+        return {} if date_format is None else {"date_format": date_format}
+
+    def _parse(self) -> Tuple[str, Tuple[int, int, int]]:
+        """
+        Return self.text reformatted and split into (year, month, day)
+
+        Known formats are parsed without regular expressions, starting with
+        date_format. The last result is kept, so mistakes made on this
+        instance's own output skip parsing entirely.
+        """
+        text = self.text
+        if self._parsed is not None and text is self._parsed[0]:
+            return self._parsed
+
+        date = None
+        if isinstance(text, str):
+            for name in (self.date_format, *self.FORMAT_PARSERS):
+                parser = self.FORMAT_PARSERS.get(name)
+                date = parser(text) if parser else None
+                if date is not None:
+                    break
+
+        if date is None:
+            text = self.reformat(text)
+            date = self._split_date(text)
+        elif name != "iso":
+            # reformat() hands ISO dates back unchanged, and rewrites the rest
+            text = self._join_date(*date)
+
+        self._parsed = (text, date)
+        return self._parsed
+
     def reformat(self, text: str) -> str:
         """
         Convert various date formats to YYYY-MM-DD
@@ -24,9 +171,9 @@ class Date(BaseMistaker):
         - YYYY-MM-DD
         """
         # Try different date patterns
-        mm_dd_yyyy = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{4})$", str(text))
-        mm_dd_yy = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{2})$", str(text))
-        yyyy_mm_dd = re.match(r"^(\d{4})-(\d{2})-(\d{2})$", str(text))
+        mm_dd_yyyy = self._MM_DD_YYYY.match(str(text))
+        mm_dd_yy = self._MM_DD_YY.match(str(text))
+        yyyy_mm_dd = self._YYYY_MM_DD.match(str(text))
 
         try:
             if mm_dd_yyyy:
@@ -71,27 +218,142 @@ class Date(BaseMistaker):
         Returns:
             Modified date string with the applied error
         """
-        self.text = self.reformat(self.text)
-        year, month, day = self._split_date(self.text)
+        self.text, (year, month, day) = self._parse()
+        date = self._apply_mistake(year, month, day, error_type, date_part)
+        result = self._join_date(*date)
+        self._parsed = (result, date)
+        return result
 
-        if error_type is None:
-            date_errors = [
-                ErrorType.ONE_DIGIT_UP,
-                ErrorType.ONE_DIGIT_DOWN,
-                ErrorType.KEY_SWAP,
-                ErrorType.ONE_DECADE_DOWN,
-                ErrorType.Y2K,
-                ErrorType.MONTH_DAY_SWAP,
-                ErrorType.MISREAD,
-                ErrorType.NUMERIC_KEY_PAD,
-                ErrorType.DIGIT_SHIFT,
+    def chaos(self, count: Optional[int] = None) -> str:
+        """
+        Apply several compounding mistakes to the date, parsing it only once
+
+        Args:
+            count: Number of mistakes to apply. If None, 1-6 are chosen randomly
+
+        Returns:
+            Date string with each mistake applied on top of the previous one
+        """
+        if count is None:
+            count = self.rand.randint(1, 6)
+
+        _, (year, month, day) = self._parse()
+        for _ in range(count):
+            year, month, day = self._apply_mistake(year, month, day)
+        return self._join_date(year, month, day)
+
+    @classmethod
+    def mistake_batch(
+        cls,
+        values: Sequence[str],
+        rands: Sequence[random.Random],
+        counts: Sequence[int],
+        error_table: Optional[AliasTable] = None,
+        date_format: Optional[str] = None,
+        date_table: Optional[DateTable] = None,
+    ) -> List[Union[str, Exception]]:
+        """
+        Apply chaos(count) to a column of dates, using NumPy when available
+
+        Unless date_format is given, the column's format is detected once
+        from a sample, and each date is parsed once into integers. The error
+        types and date parts never depend on the date itself, so dates with
+        Stream randoms have their draws taken in bulk and turned into arrays.
+        The column is then mistaken with masked integer array operations and
+        formatted in bulk, giving the same strings as the scalar path.
+        date_table is only used for the dates mistaken one at a time.
+        """
+        if vectorized.np is None or cls is not Date:
+            return super().mistake_batch(
+                values,
+                rands,
+                counts,
+                error_table,
+                date_format=date_format,
+                date_table=date_table,
+            )
+
+        table = error_table or cls.error_table
+        parser = cls(
+            error_table=table,
+            date_format=date_format or cls.detect_format(values),
+            date_table=date_table,
+        )
+        results: List[Union[str, Exception]] = list(values)
+        positions, dates = [], []
+
+        for position, (value, rand, count) in enumerate(zip(values, rands, counts)):
+            try:
+                parser.text = value
+                _, date = parser._parse()
+            except (ValueError, AttributeError) as e:
+                results[position] = e
+                continue
+            if count and isinstance(rand, Stream):
+                positions.append(position)
+                dates.append(date)
+            else:
+                parser.rand = rand
+                results[position] = parser.chaos(count)
+
+        if len(positions) < vectorized.MIN_BATCH:
+            for position in positions:
+                parser.text, parser.rand = values[position], rands[position]
+                results[position] = parser.chaos(counts[position])
+            return results
+
+        codes, parts = vectorized.draw_steps(
+            [rands[p] for p in positions],
+            [counts[p] for p in positions],
+            table,
+            vectorized._DATE_CODES,
+            len(cls.DATE_PARTS),
+        )
+        texts, escaped = vectorized.date_mistakes(dates, codes, parts)
+        error_types = {code: error for error, code in vectorized._DATE_CODES.items()}
+        for row, (done, date) in escaped.items():
+            steps = [
+                (error_types[code], cls.DATE_PARTS[part])
+                for code, part in zip(
+                    codes[row, done:].tolist(), parts[row, done:].tolist()
+                )
+                if code != vectorized._NO_ERROR
             ]
-            error_type = self.rand.choice(date_errors)
+            texts[row] = parser._replay(date, steps)
+        for position, text in zip(positions, texts):
+            results[position] = text
+        return results
 
-        if date_part is None:
-            date_part = self.rand.choice(
-                [self.DatePart.YEAR, self.DatePart.MONTH, self.DatePart.DAY]
+    def _replay(
+        self, date: Tuple[int, int, int], steps: Sequence[Tuple[ErrorType, int]]
+    ) -> str:
+        """Apply already-drawn (error type, date part) mistakes one at a time"""
+        year, month, day = date
+        for error_type, date_part in steps:
+            year, month, day = self._apply_mistake(
+                year, month, day, error_type, date_part
             )
+        return self._join_date(year, month, day)
+
+    def _apply_mistake(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        error_type: Optional[ErrorType] = None,
+        date_part: Optional[int] = None,
+    ) -> Tuple[int, int, int]:
+        """Apply one error to (year, month, day), choosing any unspecified inputs"""
+        if error_type is None:
+            error_type = self.error_table.sample(self.rand)
+
+        if date_part is None:
+            date_part = self.rand.choice(self.DATE_PARTS)
+
+        if self.date_table is not None and error_type not in self._DIRECT_ERRORS:
+            outcome = self.date_table.lookup(year, month, day, error_type, date_part)
+            if outcome is not None:
+                return outcome
 
         if error_type == ErrorType.ONE_DIGIT_UP:
             if date_part == self.DatePart.YEAR:
@@ -103,7 +365,8 @@ class Date(BaseMistaker):
 
         elif error_type == ErrorType.ONE_DIGIT_DOWN:
             if date_part == self.DatePart.YEAR:
-                year -= 1
+                if year > 0:
+                    year -= 1
             elif date_part == self.DatePart.MONTH:
                 month = ((month - 2) % 12) + 1
             else:  # DAY
@@ -111,7 +374,7 @@ class Date(BaseMistaker):
 
         elif error_type == ErrorType.KEY_SWAP:
             if date_part == self.DatePart.YEAR:
-                year_str = str(year)
+                year_str = f"{year:04d}"
                 if len(year_str) >= 4:
                     year_list = list(year_str)
                     year_list[2], year_list[3] = year_list[3], year_list[2]
@@ -122,20 +385,22 @@ class Date(BaseMistaker):
                 day = int(str(day).zfill(2)[::-1])
 
         elif error_type == ErrorType.ONE_DECADE_DOWN:
-            year -= 10
+            # Years stay non-negative: there is no decade below year 0-9
+            if year >= 10:
+                year -= 10
 
         elif error_type == ErrorType.Y2K:
             if year >= 2000:
-                year = int(f"00{str(year)[2:4]}")
+                year = int(f"{year:04d}"[2:4])
             else:
-                year = int(f"20{str(year)[2:4]}")
+                year = int("20" + f"{year:04d}"[2:4])
 
         elif error_type == ErrorType.MONTH_DAY_SWAP:
             month, day = day, month
 
         elif error_type == ErrorType.MISREAD:
             if date_part == self.DatePart.YEAR:
-                year_str = list(str(year))
+                year_str = list(f"{year:04d}")
                 if year_str[2] in MISREAD_NUMBERS:
                     year_str[2] = MISREAD_NUMBERS[year_str[2]]
                     year = int("".join(year_str))
@@ -150,7 +415,7 @@ class Date(BaseMistaker):
 
         elif error_type == ErrorType.NUMERIC_KEY_PAD:
             if date_part == self.DatePart.YEAR:
-                year_str = list(str(year))
+                year_str = list(f"{year:04d}")
                 if year_str[3] in TEN_KEYS:
                     year_str[3] = TEN_KEYS[year_str[3]]
                     year = int("".join(year_str))
@@ -165,7 +430,7 @@ class Date(BaseMistaker):
 
         elif error_type == ErrorType.DIGIT_SHIFT:
             day = month
-            month = int(str(year)[2:4])
-            year = int(f"00{str(year)[0:2]}")
+            month = int(f"{year:04d}"[2:4])
+            year = int(f"{year:04d}"[0:2])
 
-        return self._join_date(year, month, day)
+        return year, month, day
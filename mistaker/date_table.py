@@ -0,0 +1,162 @@
+from array import array
+from datetime import date
+from typing import Optional, Sequence, Tuple
+import mmap
+import struct
+import zlib
+from .constants import ErrorType
+
+
+class StaleTableError(ValueError):
+    """A saved date table was built by other mistake logic than this one's"""
+
+
+class DateTable:
+    """
+    Every single-mistake outcome for the dates in a fixed range
+
+    Outcomes are stored as int32 YYYYMMDD values, one per (date, error type,
+    date part), rather than as day numbers, because mistakes routinely make
+    dates that do not exist (a 31st month, a 0th day). A saved table is
+    memory-mapped when loaded, so worker processes share a single copy
+    through the page cache.
+    """
+
+    MAGIC = b"MSTKDT02"
+    # magic, Date.MISTAKE_VERSION, checksum of error type names, first day
+    # ordinal, number of days
+    HEADER = struct.Struct("<8sIIii")
+    PARTS = 3
+
+    FIRST = date(1900, 1, 1)
+    LAST = date(2100, 12, 31)
+
+    def __init__(
+        self,
+        values: Sequence[int],
+        error_types: Sequence[ErrorType],
+        first: int,
+        days: int,
+        path: Optional[str] = None,
+    ):
+        if len(values) != days * len(error_types) * self.PARTS:
+            raise ValueError("Date table size does not match its range")
+        self.values = values
+        self.error_types = tuple(error_types)
+        self.error_index = {error: i for i, error in enumerate(self.error_types)}
+        self.first = first
+        self.days = days
+        self.path = path
+        self.first_year = date.fromordinal(first).year
+        self.last_year = date.fromordinal(first + days - 1).year
+
+    @staticmethod
+    def _checksum(error_types: Sequence[ErrorType]) -> int:
+        return zlib.crc32(",".join(e.name for e in error_types).encode("ascii"))
+
+    @classmethod
+    def build(cls, first: date = FIRST, last: date = LAST) -> "DateTable":
+        """Work out every outcome for dates from first to last, inclusive"""
+        from .date import Date
+
+        mistaker = Date()
+        error_types = Date.ERROR_TYPES
+        values = array("i")
+        for ordinal in range(first.toordinal(), last.toordinal() + 1):
+            day = date.fromordinal(ordinal)
+            for error_type in error_types:
+                for part in range(cls.PARTS):
+                    year, month, day_ = mistaker._apply_mistake(
+                        day.year, day.month, day.day, error_type, part
+                    )
+                    values.append(year * 10000 + month * 100 + day_)
+
+        days = last.toordinal() - first.toordinal() + 1
+        return cls(values, error_types, first.toordinal(), days)
+
+    def save(self, path: str) -> None:
+        """Write the table to a file that load() can memory-map"""
+        from .date import Date
+
+        with open(path, "wb") as f:
+            f.write(
+                self.HEADER.pack(
+                    self.MAGIC,
+                    Date.MISTAKE_VERSION,
+                    self._checksum(self.error_types),
+                    self.first,
+                    self.days,
+                )
+            )
+            f.write(array("i", self.values).tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> "DateTable":
+        """
+        Memory-map a table written by save()
+
+        Raises:
+            StaleTableError: If the table was saved in an older format, or its
+                outcomes came from other mistake logic or error types
+            ValueError: If the file is not a date table at all
+        """
+        from .date import Date
+
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if mapped[:6] != cls.MAGIC[:6]:
+            raise ValueError(f"{path} is not a date table")
+        if mapped[:8] != cls.MAGIC or len(mapped) < cls.HEADER.size:
+            raise StaleTableError(f"{path} is in an older date table format")
+        _, version, checksum, first, days = cls.HEADER.unpack_from(mapped)
+        if version != Date.MISTAKE_VERSION:
+            raise StaleTableError(f"{path} was built by other date mistake logic")
+        if checksum != cls._checksum(Date.ERROR_TYPES):
+            raise StaleTableError(f"{path} was built for different date error types")
+
+        values = memoryview(mapped)[cls.HEADER.size :].cast("i")
+        return cls(values, Date.ERROR_TYPES, first, days, path)
+
+    @classmethod
+    def load_or_build(cls, path: str) -> "DateTable":
+        """
+        Load the table at path, first building and saving it if it is missing
+        or stale
+        """
+        try:
+            return cls.load(path)
+        except (FileNotFoundError, StaleTableError):
+            cls.build().save(path)
+            return cls.load(path)
+
+    def __reduce__(self):
+        # Worker processes map the same file instead of copying the values
+        if self.path is not None:
+            return (type(self).load, (self.path,))
+        return (
+            type(self),
+            (array("i", self.values), self.error_types, self.first, self.days),
+        )
+
+    def lookup(
+        self, year: int, month: int, day: int, error_type: ErrorType, date_part: int
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Return the (year, month, day) a mistake makes of a date, or None if
+        the date or mistake is not covered by the table
+        """
+        if not self.first_year <= year <= self.last_year:
+            return None
+        try:
+            offset = date(year, month, day).toordinal() - self.first
+        except ValueError:
+            return None
+        error = self.error_index.get(error_type)
+        if error is None or not 0 <= offset < self.days or not 0 <= date_part < 3:
+            return None
+
+        packed = self.values[
+            (offset * len(self.error_types) + error) * self.PARTS + date_part
+        ]
+        return packed // 10000, packed // 100 % 100, packed % 100
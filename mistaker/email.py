@@ -1,15 +1,31 @@
-from typing import Optional, Tuple, List
+from typing import Any, List, Optional, Sequence, Tuple, Union
+import random
+import re
+from .alias import AliasTable
 from .base import BaseMistaker
+from .cache import CacheInfo, LRUCache
 from .constants import ErrorType
 from .word import Word
 
+# (prefix words, domain words, tld), each word paired with its delimiter
+EmailParts = Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...], str]
+
 
 class Email(BaseMistaker):
     """Class for generating email-based mistakes"""
 
-    def __init__(self, text: str = "") -> None:
-        super().__init__(text)
-        self.word_mistaker = Word()
+    # Errors are made by Word in each part of the address
+    ERROR_TYPES = Word.ERROR_TYPES
+    error_table = Word.error_table
+
+    def __init__(
+        self,
+        text: str = "",
+        rand: Optional[random.Random] = None,
+        error_table: Optional[AliasTable] = None,
+    ) -> None:
+        super().__init__(text, rand, error_table)
+        self.word_mistaker = Word(rand=self.rand, error_table=self.error_table)
         self.original_case = ""  # Store original case
 
     def reformat(self, text: str) -> str:
@@ -29,63 +45,90 @@ class Email(BaseMistaker):
         # Always convert to lowercase
         return text_str.lower()
 
+    # Domain labels kept together as the TLD at the end of an address
+    COMMON_TLDS = frozenset({"com", "org", "edu", "net", "co", "uk"})
+
+    # A word of the local part and the delimiter that follows it, if any.
+    # [^\W_] matches exactly the characters str.isalnum() accepts
+    PREFIX_WORD = re.compile(r"([^\W_]+)([\W_]?)")
+
+    # Split addresses, keyed on the reformatted address
+    split_cache = LRUCache(maxsize=8192)
+
     def _is_tld(self, part: str) -> bool:
         """Check if a part is a TLD component"""
-        common_tlds = {"com", "org", "edu", "net", "co", "uk"}
-        return part in common_tlds
+        return part in self.COMMON_TLDS
 
-    def _split_email_parts(
-        self, email: str
-    ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]], str]:
+    def _split_email_parts(self, email: str) -> EmailParts:
         """
         Split email into parts, preserving delimiters
         Returns (prefix_parts, domain_parts, tld)
         Each part is a tuple of (text, delimiter)
+
+        Splits are cached per address, so duplicates of a record share one.
         """
+        return self.split_cache.get_or_compute(
+            email, lambda: self._build_email_parts(email)
+        )
+
+    def _build_email_parts(self, email: str) -> EmailParts:
+        """Split an address that is not in the cache"""
         # Split into prefix and domain
         prefix_str, domain_full = email.split("@")
 
-        # Handle prefix parts by splitting on non-alphanumeric characters
-        prefix_parts = []
-        current_part = ""
-        i = 0
-
-        while i < len(prefix_str):
-            if prefix_str[i].isalnum():
-                current_part += prefix_str[i]
-            else:
-                # Found a delimiter
-                if current_part:  # Only add if we have a word
-                    # Look ahead to collect all consecutive delimiters
-                    delim = prefix_str[i]
-                    prefix_parts.append((current_part, delim))
-                    current_part = ""
-            i += 1
-
-        # Add the last part if exists
-        if current_part:
-            prefix_parts.append((current_part, ""))
-
-        # Handle domain parts and TLD
-        domain_parts = []
-        parts = domain_full.split(".")
+        # Words of the prefix, each with the first delimiter after it. Leading
+        # and repeated delimiters are dropped
+        prefix_parts = tuple(self.PREFIX_WORD.findall(prefix_str))
 
         # Find TLD components
+        parts = domain_full.split(".")
         tld_start = len(parts)
         for i in range(len(parts) - 1, -1, -1):
             if not self._is_tld(parts[i]):
                 tld_start = i + 1
                 break
 
-        # Process domain parts before TLD
-        for i in range(tld_start):
-            domain_parts.append((parts[i], "."))
-
-        # Combine remaining parts into TLD
+        # Parts before the TLD keep their dot; the rest make up the TLD
+        domain_parts = tuple((part, ".") for part in parts[:tld_start])
         tld = ".".join(parts[tld_start:])
 
         return prefix_parts, domain_parts, tld
 
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Hit, miss and eviction counts for the shared split cache"""
+        return cls.split_cache.info()
+
+    @classmethod
+    def mistake_batch(
+        cls,
+        values: Sequence[str],
+        rands: Sequence[random.Random],
+        counts: Sequence[int],
+        error_table: Optional[AliasTable] = None,
+        **options: Any,
+    ) -> List[Union[str, Exception]]:
+        """
+        Apply chaos(count) to a column of emails
+
+        One Email and its Word are reused for the whole column, switching
+        random streams between values, rather than building both for every
+        address. Results are the same as one value at a time.
+        """
+        if cls is not Email:
+            return super().mistake_batch(values, rands, counts, error_table, **options)
+
+        email = cls(error_table=error_table, **options)
+        results: List[Union[str, Exception]] = []
+        for value, rand, count in zip(values, rands, counts):
+            email.rand = email.word_mistaker.rand = rand
+            email.text = value
+            try:
+                results.append(email.chaos(count))
+            except (ValueError, AttributeError) as e:
+                results.append(e)
+        return results
+
     def mistake(
         self, error_type: Optional[ErrorType] = None, index: Optional[int] = None
     ) -> str:
@@ -107,23 +150,23 @@ class Email(BaseMistaker):
         if index is not None:
             current_pos = 0
             made_mistake = False
-            result = ""
+            result = []
 
             # Handle prefix parts
             for word, delim in prefix_parts:
                 if index >= current_pos and index < current_pos + len(word):
                     self.word_mistaker.text = word
-                    result += self.word_mistaker.mistake(
-                        error_type, index - current_pos
+                    result.append(
+                        self.word_mistaker.mistake(error_type, index - current_pos)
                     )
                     made_mistake = True
                 else:
-                    result += word
-                result += delim
+                    result.append(word)
+                result.append(delim)
                 current_pos += len(word) + len(delim)
 
             # Add @ symbol
-            result += "@"
+            result.append("@")
             current_pos += 1
 
             # Handle domain parts
@@ -134,47 +177,67 @@ class Email(BaseMistaker):
                     and index < current_pos + len(word)
                 ):
                     self.word_mistaker.text = word
-                    result += self.word_mistaker.mistake(
-                        error_type, index - current_pos
+                    result.append(
+                        self.word_mistaker.mistake(error_type, index - current_pos)
                     )
                 else:
-                    result += word
-                result += delim
+                    result.append(word)
+                result.append(delim)
                 current_pos += len(word) + len(delim)
 
             # Add TLD
-            result += tld
+            result.append(tld)
 
-            return result.lower()
+            return "".join(result).lower()
 
         # Random mistake when no index provided
-        all_parts = prefix_parts + domain_parts
-        part_to_modify = self.rand.randint(0, len(all_parts) - 1)
-
-        result = ""
-
-        # Add prefix parts
-        for i, (word, delim) in enumerate(prefix_parts):
-            if i == part_to_modify:
-                self.word_mistaker.text = word
-                result += self.word_mistaker.mistake(error_type)
-            else:
-                result += word
-            result += delim
-
-        # Add @ symbol
-        result += "@"
-
-        # Add domain parts
-        for i, (word, delim) in enumerate(domain_parts):
-            if i + len(prefix_parts) == part_to_modify:
-                self.word_mistaker.text = word
-                result += self.word_mistaker.mistake(error_type)
-            else:
-                result += word
-            result += delim
-
-        # Add TLD
-        result += tld
-
-        return result.lower()
+        return self._mistake_words(prefix_parts, domain_parts, tld, 1, error_type)
+
+    def chaos(self, count: Optional[int] = None) -> str:
+        """
+        Apply several compounding mistakes to the email, splitting it only once
+
+        Args:
+            count: Number of mistakes to apply. If None, 1-6 are chosen randomly
+
+        Returns:
+            Email with each mistake applied on top of the previous one
+        """
+        if count is None:
+            count = self.rand.randint(1, 6)
+
+        if not self.text:
+            return ""
+
+        text = self.reformat(self.text)
+        if not text:
+            return ""
+
+        prefix_parts, domain_parts, tld = self._split_email_parts(text)
+        return self._mistake_words(prefix_parts, domain_parts, tld, count)
+
+    def _mistake_words(
+        self,
+        prefix_parts: Sequence[Tuple[str, str]],
+        domain_parts: Sequence[Tuple[str, str]],
+        tld: str,
+        count: int,
+        error_type: Optional[ErrorType] = None,
+    ) -> str:
+        """Make count word mistakes in randomly chosen parts and rebuild the email"""
+        words = [word for word, _ in prefix_parts + domain_parts]
+
+        for _ in range(count):
+            part_to_modify = self.rand.randint(0, len(words) - 1)
+            self.word_mistaker.text = words[part_to_modify]
+            words[part_to_modify] = self.word_mistaker.mistake(error_type)
+
+        prefix_count = len(prefix_parts)
+        pieces = [word + delim for word, (_, delim) in zip(words, prefix_parts)]
+        pieces.append("@")
+        pieces += [
+            word + delim for word, (_, delim) in zip(words[prefix_count:], domain_parts)
+        ]
+        pieces.append(tld)
+
+        return "".join(pieces).lower()
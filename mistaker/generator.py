@@ -1,6 +1,22 @@
-from typing import Dict, List, Optional, Iterator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Iterator,
+    Iterable,
+    Sequence,
+    Tuple,
+)
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain, islice
+from multiprocessing.context import BaseContext
 import random
 import json
+from . import arrow
 from .address import Address
 from .word import Word
 from .name import Name
@@ -8,6 +24,10 @@ from .date import Date
 from .number import Number
 from .email import Email
 from .license_number import LicenseNumber
+from .alias import AliasTable
+from .date_table import DateTable
+from .plan import MistakePlan
+from .rng import stream
 
 
 class Generator:
@@ -15,16 +35,23 @@ class Generator:
     Core generator class for creating realistic data entry mistakes
     """
 
-    SUPPORTED_FIELDS = {
-        "full_name",
-        "dob",
-        "phone",
-        "email",
-        "ssn",
-        "dl_num",
-        "full_address",
+    # Mistaker class used for each supported field
+    FIELD_MISTAKERS = {
+        "full_name": Name,
+        "dob": Date,
+        "phone": Number,
+        "email": Email,
+        "ssn": Number,
+        "dl_num": LicenseNumber,
+        "full_address": Address,
     }
 
+    # A tuple rather than a set so field order never depends on hash seeds
+    SUPPORTED_FIELDS = tuple(FIELD_MISTAKERS)
+
+    # Rows a plan samples to work out per-column settings such as date formats
+    PLAN_SAMPLE_ROWS = 100
+
     def __init__(
         self,
         config: Optional[Dict] = None,
@@ -32,8 +59,24 @@ class Generator:
         max_duplicates: int = 5,
         min_chaos: int = 1,
         max_chaos: int = 3,
+        seed: Optional[int] = None,
     ):
-        """Initialize the generator with configuration"""
+        """
+        Initialize the generator with configuration
+
+        Every record, duplicate and field draws from its own random stream
+        derived from ``seed``, so a seeded generator reproduces any record
+        from its input position alone. Without a seed one is chosen at random.
+        """
+        if config and config.get("seed") is not None and seed is None:
+            seed = config["seed"]
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self._next_index = 0
+        self._plans: Dict[Tuple[str, ...], MistakePlan] = {}
+        self.error_tables: Dict[str, AliasTable] = {}
+        self.date_table: Optional[DateTable] = None
+        self.field_options: Dict[str, Dict[str, Any]] = {}
+
         self.config = self._normalize_config(config or {})
         # Remove this update that was overwriting config values
         if config:
@@ -84,6 +127,7 @@ class Generator:
         # Ensure all config sections exist
         config.setdefault("missing_weights", {})
         config.setdefault("mistake_weights", {})
+        config.setdefault("error_weights", {})
 
         # Set default weights for all supported fields
         for field in self.SUPPORTED_FIELDS:
@@ -94,6 +138,9 @@ class Generator:
 
     def validate_config(self):
         """Validate configuration values"""
+        # Plans are compiled from the config, so drop any built from old values
+        self._plans = {}
+
         if self.config["min_duplicates"] > self.config["max_duplicates"]:
             raise ValueError("min_duplicates cannot be greater than max_duplicates")
 
@@ -107,94 +154,439 @@ class Generator:
                     f"Missing weight for {field} ({weight}) not between 0 and 1"
                 )
 
-    def should_field_be_missing(self, field: str) -> bool:
-        """Determine if a field should be missing based on its weight"""
-        weight = self.config["missing_weights"].get(field, 0.1)
-        return random.random() < weight
+        # Validate mistake weights are between 0 and 1
+        for field, weight in self.config["mistake_weights"].items():
+            if not 0 <= weight <= 1:
+                raise ValueError(
+                    f"Mistake weight for {field} ({weight}) not between 0 and 1"
+                )
 
-    def generate_mistakes(self, record: Dict[str, str]) -> Dict[str, str]:
-        """Generate mistakes for a single record with improved nickname handling"""
-        new_record = record.copy()
-        chaos_level = random.randint(self.config["min_chaos"], self.config["max_chaos"])
+        self.error_tables = self._compile_error_tables(self.config["error_weights"])
+
+        # Map the precomputed date mistakes, building the file on first use,
+        # and hand them to this generator's date columns only
+        path = self.config.get("date_table")
+        if not path:
+            self.date_table = None
+        elif self.date_table is None or self.date_table.path != path:
+            self.date_table = DateTable.load_or_build(path)
+        self.field_options = {
+            field: {"date_table": self.date_table}
+            for field, mistaker in self.FIELD_MISTAKERS.items()
+            if self.date_table is not None and issubclass(mistaker, Date)
+        }
+
+    def _compile_error_tables(
+        self, error_weights: Dict[str, Dict[str, float]]
+    ) -> Dict[str, AliasTable]:
+        """
+        Build a weighted alias table per field from error_weights
 
-        for field in self.SUPPORTED_FIELDS:
-            if field not in new_record:
-                continue
+        Error types a field leaves out keep a weight of 1.0, so only the
+        errors being tuned need to be listed.
+        """
+        tables = {}
+        for field, weights in error_weights.items():
+            mistaker = self.FIELD_MISTAKERS.get(field)
+            if mistaker is None:
+                raise ValueError(f"Error weights given for unsupported field {field}")
+            if not mistaker.ERROR_TYPES:
+                raise ValueError(f"Error weights are not supported for {field}")
+
+            names = {error_type.name for error_type in mistaker.ERROR_TYPES}
+            for name, weight in weights.items():
+                if name not in names:
+                    raise ValueError(
+                        f"Unknown error type {name} for {field}, "
+                        f"expected one of {', '.join(sorted(names))}"
+                    )
+                if weight < 0:
+                    raise ValueError(
+                        f"Error weight for {field}.{name} ({weight}) is negative"
+                    )
+
+            field_weights = [weights.get(t.name, 1.0) for t in mistaker.ERROR_TYPES]
+            if not any(field_weights):
+                raise ValueError(f"Error weights for {field} are all zero")
+            tables[field] = AliasTable(mistaker.ERROR_TYPES, field_weights)
+        return tables
+
+    def should_field_be_missing(
+        self, field: str, rand: Optional[random.Random] = None
+    ) -> bool:
+        """Determine if a field should be missing based on its weight"""
+        weight = self.config["missing_weights"].get(field, 0.1)
+        return (rand or random).random() < weight
+
+    def _claim_index(self, index: Optional[int]) -> int:
+        """Use the given record index, or the next one if none is given"""
+        if index is None:
+            index = self._next_index
+        self._next_index = index + 1
+        return index
+
+    def compile_plan(
+        self, fieldnames: Iterable[str], sample: Sequence[Sequence[str]] = ()
+    ) -> MistakePlan:
+        """
+        Return the mistake plan for records with these fields, compiling it once
 
-            if not new_record[field] or self.should_field_be_missing(field):
-                new_record[field] = ""
-                continue
+        Args:
+            fieldnames: Field name of each column
+            sample: First rows of the input, laid out like fieldnames, for
+                per-column settings. Only used if the plan is compiled now
+        """
+        fieldnames = tuple(fieldnames)
+        plan = self._plans.get(fieldnames)
+        if plan is None:
+            plan = MistakePlan(
+                self.config,
+                fieldnames,
+                self.FIELD_MISTAKERS,
+                self.error_tables,
+                sample,
+                self.field_options,
+            )
+            self._plans[fieldnames] = plan
+        return plan
 
-            try:
-                if field == "full_name":
-                    name = Name(new_record[field])
-                    for _ in range(chaos_level):
-                        new_record[field] = name.mistake()
-
-                elif field == "dob":
-                    date = Date(new_record[field])
-                    for _ in range(chaos_level):
-                        new_record[field] = date.mistake()
-
-                elif field == "phone" or field == "ssn":
-                    number = Number(new_record[field])
-                    for _ in range(chaos_level):
-                        new_record[field] = number.mistake()
-
-                elif field == "email":
-                    email = Email(new_record[field])
-                    for _ in range(chaos_level):
-                        new_record[field] = email.mistake()
-
-                elif field == "dl_num":
-                    dl = LicenseNumber(new_record[field])
-                    for _ in range(chaos_level):
-                        new_record[field] = dl.mistake()
-
-                elif field == "full_address":
-                    address = Address(new_record[field])
-                    for _ in range(chaos_level):
-                        new_record[field] = address.mistake()
-
-            except (ValueError, AttributeError) as e:
-                print(f"Warning: Error processing field {field}: {str(e)}")
-                pass
+    def _duplicate_count(self, index: int) -> int:
+        """Number of mistaken duplicates made of the record at index"""
+        return stream(self.seed, index).randint(
+            self.config["min_duplicates"], self.config["max_duplicates"]
+        )
 
-        return new_record
+    def generate_mistakes(
+        self,
+        record: Dict[str, str],
+        index: Optional[int] = None,
+        duplicate: int = 1,
+    ) -> Dict[str, str]:
+        """
+        Generate mistakes for a single record with improved nickname handling
 
-    def generate(self, record: Dict[str, str]) -> List[Dict[str, str]]:
+        Args:
+            record: Dictionary containing the original record data
+            index: Position of the record in the input, used to select its
+                random streams. If None, the generator's next index is used
+            duplicate: Which duplicate of the record this is (1-based)
+        """
+        if index is None:
+            index = self._claim_index(None)
+        row = list(record.values())
+        plan = self.compile_plan(record, [row])
+        row = plan.apply(row, self.seed, index, duplicate)
+        return dict(zip(plan.fieldnames, row))
+
+    def generate(
+        self, record: Dict[str, str], index: Optional[int] = None
+    ) -> List[Dict[str, str]]:
         """
         Generate a list of records with mistakes from a single record
 
         Args:
             record: Dictionary containing the original record data
+            index: Position of the record in the input. If None, the
+                generator's next index is used
 
         Returns:
             List of dictionaries containing the original and modified records
         """
+        index = self._claim_index(index)
         results = [record]  # Include original record
 
-        num_duplicates = random.randint(
-            self.config["min_duplicates"], self.config["max_duplicates"]
-        )
-
-        for _ in range(num_duplicates):
-            mistake_record = self.generate_mistakes(record)
+        for duplicate in range(1, self._duplicate_count(index) + 1):
+            mistake_record = self.generate_mistakes(record, index, duplicate)
             results.append(mistake_record)
 
         return results
 
+    def generate_batch(
+        self, columns: Dict[str, Sequence[str]], start: Optional[int] = None
+    ) -> Tuple[Dict[str, List[str]], List[int]]:
+        """
+        Generate mistakes for a batch of records given as columns
+
+        Rows come out in the same order, and with the same values, as
+        generate_all() would give for the equivalent records, but each
+        field's mistakes are made down the whole column in one pass.
+
+        Args:
+            columns: Field name -> equal-length list (or NumPy object array)
+                of values
+            start: Input position of the first record. If None, the
+                generator's next index is used
+
+        Returns:
+            (output columns, cluster ids): the cluster id of each output row
+            is the input position of the record it was generated from
+        """
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        count = lengths.pop() if lengths else 0
+
+        sources, cluster_ids, duplicates = self._expand_batch(start, count)
+        plan = self.compile_plan(
+            columns,
+            list(
+                zip(*(column[: self.PLAN_SAMPLE_ROWS] for column in columns.values()))
+            ),
+        )
+
+        output = {
+            field: [column[source] for source in sources]
+            for field, column in columns.items()
+        }
+        for step in plan.steps:
+            output[step.field] = plan.apply_column(
+                step, output[step.field], self.seed, cluster_ids, duplicates
+            )
+
+        return output, cluster_ids
+
+    def generate_record_batch(
+        self, batch: "arrow.pa.RecordBatch", start: Optional[int] = None
+    ) -> "arrow.pa.RecordBatch":
+        """
+        Generate mistakes for an Apache Arrow record batch (requires pyarrow)
+
+        Rows come out as generate_batch() would give them. Only the columns
+        that get mistakes are turned into Python strings, and they come back
+        as string columns; every other column stays in Arrow and is gathered
+        with take(), without a Python object per value. Values that a
+        duplicate leaves blank, or that were null to begin with, are null.
+
+        Args:
+            batch: Record batch of input records
+            start: Input position of the first record. If None, the
+                generator's next index is used
+        """
+        pa = arrow.require_pyarrow()
+        sources, cluster_ids, duplicates = self._expand_batch(start, batch.num_rows)
+        plan = self.compile_plan(
+            batch.schema.names,
+            arrow.batch_to_rows(batch.slice(0, self.PLAN_SAMPLE_ROWS)),
+        )
+        steps = {step.index: step for step in plan.steps}
+        indices = pa.array(sources, type=pa.int64())
+
+        columns = []
+        for position, column in enumerate(batch.columns):
+            step = steps.get(position)
+            if step is None:
+                columns.append(column.take(indices))
+                continue
+            values = arrow.as_strings(column).to_pylist()
+            values = plan.apply_column(
+                step,
+                [values[source] for source in sources],
+                self.seed,
+                cluster_ids,
+                duplicates,
+            )
+            # Blanked and null values in duplicates come out as nulls
+            values = [
+                value if duplicate == 0 else value or None
+                for value, duplicate in zip(values, duplicates)
+            ]
+            columns.append(pa.array(values, type=pa.string()))
+
+        schema = arrow.mistaken_schema(batch.schema, steps)
+        return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+    def _expand_batch(
+        self, start: Optional[int], count: int
+    ) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Claim input positions for count records and expand each record into
+        its original plus its duplicates
+
+        Returns:
+            (sources, cluster ids, duplicates): for each output row, the
+            offset of its record in the batch, that record's input position,
+            and its duplicate number (0 for the original)
+        """
+        start = self._claim_index(start)
+        self._next_index = start + count
+
+        sources, cluster_ids, duplicates = [], [], []
+        for offset in range(count):
+            index = start + offset
+            copies = 1 + self._duplicate_count(index)
+            sources.extend([offset] * copies)
+            cluster_ids.extend([index] * copies)
+            duplicates.extend(range(copies))
+        return sources, cluster_ids, duplicates
+
     def generate_all(
-        self, records: Iterator[Dict[str, str]]
+        self,
+        records: Iterable[Dict[str, str]],
+        workers: int = 1,
+        chunk_size: int = 1000,
+        start: Optional[int] = None,
+        mp_context: Optional[BaseContext] = None,
     ) -> Iterator[Dict[str, str]]:
         """
         Generate mistakes for multiple records
 
         Args:
             records: Iterator of dictionaries containing the original records
+            workers: Number of worker processes. 1 processes records in-process
+            chunk_size: Number of input records sent to a worker at a time
+            start: Input position of the first record. With a fixed seed,
+                a slice of the input starting at ``start`` reproduces exactly
+                the output of a full run for those records. If None, records
+                continue from the generator's next index, so consecutive
+                calls draw from fresh streams
+            mp_context: multiprocessing context to start workers from. None
+                uses the platform default
 
         Yields:
-            Modified records with mistakes, including originals
+            Modified records with mistakes, including originals, in input order
         """
-        for record in records:
-            yield from self.generate(record)
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if start is None:
+            start = self._next_index
+
+        if workers == 1:
+            for index, record in enumerate(records, start):
+                yield from self.generate(record, index)
+            return
+
+        yield from self._generate_parallel(
+            _generate_chunk, iter(records), workers, chunk_size, start, mp_context
+        )
+
+    def generate_rows(
+        self,
+        rows: Iterable[Sequence[str]],
+        fieldnames: Sequence[str],
+        workers: int = 1,
+        chunk_size: int = 1000,
+        start: Optional[int] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> Iterator[Sequence[str]]:
+        """
+        Generate mistakes for records given as rows of values
+
+        Gives the same output as generate_all() without building a dict per
+        record. Each duplicate is a shallow copy of its original row, so
+        values that are not mistaken are shared rather than copied, and only
+        the mutated slots are replaced.
+
+        Args:
+            rows: Iterable of rows, each with one value per fieldname
+            fieldnames: Field name of each column, resolved to mistake steps
+                once for the whole input
+            workers: Number of worker processes. 1 processes rows in-process
+            chunk_size: Number of input rows sent to a worker at a time
+            start: Input position of the first row, as for generate_all()
+            mp_context: multiprocessing context to start workers from, as for
+                generate_all()
+
+        Yields:
+            Each original row as given, followed by its mistaken duplicates
+            as lists, in input order
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if start is None:
+            start = self._next_index
+
+        if workers > 1:
+            yield from self._generate_parallel(
+                partial(_generate_row_chunk, tuple(fieldnames)),
+                iter(rows),
+                workers,
+                chunk_size,
+                start,
+                mp_context,
+            )
+            return
+
+        # A list is sampled as far as the plan wants, but a stream only
+        # lends its first row, so no output waits for input beyond it
+        if isinstance(rows, list):
+            sample = rows[: self.PLAN_SAMPLE_ROWS]
+        else:
+            rows = iter(rows)
+            sample = list(islice(rows, 1))
+            rows = chain(sample, rows)
+        plan = self.compile_plan(fieldnames, sample)
+        for index, row in enumerate(rows, start):
+            self._next_index = index + 1
+            yield row
+            for duplicate in range(1, self._duplicate_count(index) + 1):
+                yield plan.apply(list(row), self.seed, index, duplicate)
+
+    def _generate_parallel(
+        self,
+        task: Callable[[int, List], List],
+        records: Iterator,
+        workers: int,
+        chunk_size: int,
+        start: int,
+        mp_context: Optional[BaseContext] = None,
+    ) -> Iterator:
+        """
+        Fan chunks of records out to a process pool and yield results in order.
+
+        ``task(start, chunk)`` runs in a worker and returns the output for
+        a chunk. Only a bounded number of chunks are in flight at once, so
+        the input is consumed lazily and memory stays flat for arbitrarily
+        long inputs.
+        """
+        pending = deque()
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self,),
+        )
+        try:
+            while True:
+                while len(pending) < workers * 2:
+                    chunk = list(islice(records, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(task, start, chunk))
+                    start += len(chunk)
+                    self._next_index = start
+
+                if not pending:
+                    break
+
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Generator instance installed in each worker process by _init_worker
+_worker_generator: Optional[Generator] = None
+
+
+def _init_worker(generator: Generator) -> None:
+    """Process pool initializer: keep one copy of the generator per worker"""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _generate_chunk(start: int, chunk: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Generate all variations for a chunk of records inside a worker"""
+    results = []
+    for index, record in enumerate(chunk, start):
+        results.extend(_worker_generator.generate(record, index))
+    return results
+
+
+def _generate_row_chunk(
+    fieldnames: Tuple[str, ...], start: int, chunk: List[Sequence[str]]
+) -> List[Sequence[str]]:
+    """Generate all variations for a chunk of rows inside a worker"""
+    return list(_worker_generator.generate_rows(chunk, fieldnames, start=start))
@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 import re
 import random
+from .alias import AliasTable
+from .cache import CacheInfo, LRUCache
 from .number import Number
 from .constants import ErrorType
 from .base import BaseMistaker
@@ -9,8 +11,36 @@ from .base import BaseMistaker
 class LicenseNumber(BaseMistaker):
     """Class for generating license number mistakes that only affect numeric portions"""
 
-    def __init__(self, text: str = ""):
-        super().__init__(text)
+    # Errors are made by Number in each numeric segment
+    ERROR_TYPES = Number.ERROR_TYPES
+    error_table = Number.error_table
+
+    # Splitting on a captured digit run leaves the numeric segments at the
+    # odd positions: "AB12C3" -> ("AB", "12", "C", "3", "")
+    NUMERIC_RUN = re.compile(r"(\d+)")
+
+    # Segments of each license number, keyed on the number
+    segment_cache = LRUCache(maxsize=8192)
+
+    def __init__(
+        self,
+        text: str = "",
+        rand: Optional[random.Random] = None,
+        error_table: Optional[AliasTable] = None,
+    ):
+        super().__init__(text, rand, error_table)
+        self.number_mistaker = Number(rand=self.rand, error_table=self.error_table)
+
+    def _segments(self, text: str) -> Tuple[str, ...]:
+        """Alternating letter and digit segments of text, cached per number"""
+        return self.segment_cache.get_or_compute(
+            text, lambda: tuple(self.NUMERIC_RUN.split(text))
+        )
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Hit, miss and eviction counts for the shared segment cache"""
+        return cls.segment_cache.info()
 
     def mistake(
         self, error_type: Optional[ErrorType] = None, index: Optional[int] = None
@@ -19,48 +49,45 @@ class LicenseNumber(BaseMistaker):
         if not self.text:
             return ""
 
-        # Split the text into numeric and non-numeric parts while preserving positions
-        parts = []
-        current_part = ""
-        current_type = None  # None, 'num', or 'alpha'
-
-        for char in self.text:
-            new_type = "num" if char.isdigit() else "alpha"
-            if current_type != new_type and current_part:
-                parts.append((current_type, current_part))
-                current_part = ""
-            current_type = new_type
-            current_part += char
-
-        if current_part:
-            parts.append((current_type, current_part))
-
-        # Only make mistakes in the numeric parts
-        result = ""
-        for part_type, part in parts:
-            if part_type == "num":
-                # Create a temporary Number instance for this numeric part
-                temp_number = Number(part)
-                result += temp_number.mistake(error_type)
-            else:
-                result += part
-
-        return result
+        # Only make mistakes in the numeric parts, each with the shared Number
+        parts = list(self._segments(self.text))
+        self._mistake_segments(parts, error_type)
+        return "".join(parts)
+
+    def chaos(self, count: Optional[int] = None) -> str:
+        """
+        Apply several compounding mistakes, segmenting the number only once
+
+        Number mistakes keep each digit run the same length and all digits,
+        so every mistake's output splits into the same segments.
+        """
+        if count is None:
+            count = self.rand.randint(1, 6)
+
+        if not count or not self.text:
+            return super().chaos(count)
+
+        parts = list(self._segments(self.text))
+        for _ in range(count):
+            self._mistake_segments(parts)
+        return "".join(parts)
+
+    def _mistake_segments(
+        self, parts: List[str], error_type: Optional[ErrorType] = None
+    ) -> None:
+        """Make a Number mistake in every digit run of parts, in place"""
+        number = self.number_mistaker
+        for i in range(1, len(parts), 2):
+            # Digit runs are already in Number's format
+            number.text = number._formatted = parts[i]
+            parts[i] = number.mistake(error_type)
 
     @classmethod
-    def make_mistake(cls, text: str) -> str:
+    def make_mistake(cls, text: str, rand: Optional[random.Random] = None) -> str:
         """Class method for one-off mistake generation"""
-        instance = cls(text)
+        instance = cls(text, rand=rand)
         # Force a modification by using a random error type from Number class
-        number_errors = [
-            ErrorType.ONE_DIGIT_UP,
-            ErrorType.ONE_DIGIT_DOWN,
-            ErrorType.KEY_SWAP,
-            ErrorType.DIGIT_SHIFT,
-            ErrorType.MISREAD,
-            ErrorType.NUMERIC_KEY_PAD,
-        ]
-        error_type = random.choice(number_errors)
+        error_type = instance.error_table.sample(instance.rand)
         return instance.mistake(error_type)
 
     def reformat(self, text: str) -> str:
@@ -1,6 +1,11 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, FrozenSet, Tuple
 import random
+import sys
+import threading
+from .alias import AliasTable
 from .word import Word
+from .cache import LRUCache
+from .translate import NAME_CHARS
 from .constants import ErrorType
 
 
@@ -13,24 +18,36 @@ class Name(Word):
     COMMON_PREFIXES = {"MR", "MRS", "MS", "DR", "PROF"}
     COMMON_SUFFIXES = {"JR", "SR", "II", "III", "IV", "PHD", "MD", "ESQ"}
 
+    # mistake() samples name variations rather than drawing error types
+    ERROR_TYPES = ()
+
+    # Dropped or doubled letters can leave spaces that reformat() collapses
+    MISTAKES_KEEP_FORMAT = False
+
+    # Upper-cased first name -> sorted nicknames, built once per process
+    _nickname_index: Optional[Dict[str, Tuple[str, ...]]] = None
+    _nickname_lock = threading.Lock()
+
+    # Name variations and variation templates, keyed on the
+    # whitespace-normalized name
+    variations_cache = LRUCache(maxsize=4096)
+    space_cache = LRUCache(maxsize=4096)
+
     @classmethod
-    def make_mistake(cls, text: str) -> str:
+    def make_mistake(cls, text: str, rand: Optional[random.Random] = None) -> str:
         """Class method for one-off mistake generation"""
-        instance = cls(text)
+        instance = cls(text, rand=rand)
         # Force a modification by using a random error type
-        error_types = [
-            ErrorType.DROPPED_LETTER,
-            ErrorType.DOUBLE_LETTER,
-            ErrorType.MISREAD_LETTER,
-            ErrorType.MISTYPED_LETTER,
-            ErrorType.EXTRA_LETTER,
-            ErrorType.MISHEARD_LETTER,
-        ]
-        return instance.mistake(random.choice(error_types))
-
-    def __init__(self, text: str = ""):
+        return instance.mistake(Word.error_table.sample(instance.rand))
+
+    def __init__(
+        self,
+        text: str = "",
+        rand: Optional[random.Random] = None,
+        error_table: Optional[AliasTable] = None,
+    ):
         self.original_text = text
-        super().__init__(text)
+        super().__init__(text, rand, error_table)
 
     def get_case_variants(self) -> List[str]:
         """Returns common case variants of the name"""
@@ -52,86 +69,174 @@ class Name(Word):
             return self.text == other_name
         return self.text.upper() == other_name.upper()
 
-    def _get_nickname_variations(self, first_name: str) -> List[str]:
-        """Get nickname variations for a given first name"""
+    @classmethod
+    def nickname_index(cls) -> Dict[str, Tuple[str, ...]]:
+        """
+        Return the shared nickname lookup, loading the nickname tables on
+        first use. Keys are upper-case names, values sorted lower-case nicknames.
+        """
+        if cls._nickname_index is None:
+            with cls._nickname_lock:
+                if Name._nickname_index is None:
+                    Name._nickname_index = cls._build_nickname_index()
+        return Name._nickname_index
+
+    @staticmethod
+    def _build_nickname_index() -> Dict[str, Tuple[str, ...]]:
+        """Load the nicknames package tables into an upper-case keyed dict"""
         try:
             from nicknames import NickNamer
 
-            namer = NickNamer()
-
-            variations = set()
-            nicknames = namer.nicknames_of(first_name)
-            if nicknames:
-                variations.update(nicknames)
-
-            return list(variations)
+            lookup = NickNamer().nickname_lookup
         except ImportError:
             print(
-                "Warning: nicknames package not installed. Run 'pip install nicknames' to enable nickname generation."
+                "Warning: nicknames package not installed. Run 'pip install nicknames' to enable nickname generation.",
+                file=sys.stderr,
             )
-            return []
+            return {}
         except Exception as e:
-            print(f"Warning: Error getting nicknames for {first_name}: {str(e)}")
-            return []
+            print(f"Warning: Error loading nicknames: {str(e)}", file=sys.stderr)
+            return {}
+
+        return {
+            name.upper(): tuple(sorted(nicknames))
+            for name, nicknames in lookup.items()
+            if nicknames
+        }
+
+    def _get_nickname_variations(self, first_name: str) -> List[str]:
+        """Get nickname variations for a given first name"""
+        return list(self.nickname_index().get(first_name.strip().upper(), ()))
 
     def get_name_variations(self) -> List[str]:
         """Generate basic name variations including nicknames"""
+        return list(self._cached_variations())
+
+    def _cached_variations(self) -> Tuple[str, ...]:
+        """Name variations for the current text, built once per distinct name"""
+        key = " ".join(str(self.text or "").split())
+        return self.variations_cache.get_or_compute(key, self._build_variations)
+
+    def _build_variations(self) -> Tuple[str, ...]:
+        """Build every name variation, deduplicated in a stable order"""
+        first_names, templates, _ = self._variation_space()
+        variations = (
+            self._render_variation(first, template)
+            for first in first_names
+            for template in templates
+        )
+        return tuple(dict.fromkeys(variations))
+
+    def sample_variation(self) -> str:
+        """
+        Pick one name variation at random without building the full list
+
+        A single random index is split, mixed-radix style, into a first name
+        (original or nickname) and a template, so the cost stays the same no
+        matter how many nicknames or middle names the name has. First names
+        that share an initial render the same initial-only variation, so only
+        the first of them may produce it; other draws of it are redrawn, which
+        keeps every distinct variation equally likely.
+        """
+        first_names, templates, initial_owners = self._variation_space()
+        while True:
+            first_index, template_index = divmod(
+                self.rand.randrange(len(first_names) * len(templates)),
+                len(templates),
+            )
+            template = templates[template_index]
+            if not template[1] or first_index in initial_owners:
+                return self._render_variation(first_names[first_index], template)
+
+    def _variation_space(
+        self,
+    ) -> Tuple[Tuple[str, ...], Tuple[Tuple, ...], FrozenSet[int]]:
+        """First-name choices and variation templates, cached per distinct name"""
+        key = " ".join(str(self.text or "").split())
+        return self.space_cache.get_or_compute(key, self._build_variation_space)
+
+    def _build_variation_space(
+        self,
+    ) -> Tuple[Tuple[str, ...], Tuple[Tuple, ...], FrozenSet[int]]:
+        """
+        Describe every name variation as (first name, template) pairs
+
+        Each template is (before, use_initial, after): a variation is
+        before + first name (or its initial) + after. Every first name uses
+        the same templates, in the order variations have always been listed,
+        with repeated templates dropped (a one-letter middle name gives the
+        same middle and middle-initial templates).
+
+        Returns:
+            (first names, templates, initial owners): the owners are the
+            positions of the first name to use each distinct initial
+        """
         parts = self.get_parts()
-        variations = []
 
-        # Start with original first name
+        # Start with original first name, then its nicknames
         first_names = [parts["first"]]
+        first_names.extend(self._get_nickname_variations(parts["first"]))
+
+        last = parts["last"]
+        middle = " ".join(parts["middle"])
+        prefix = parts["prefix"]
+        suffix = parts["suffix"]
 
-        # Add nicknames
-        nicknames = self._get_nickname_variations(parts["first"])
-        first_names.extend(nicknames)
+        # Basic variations
+        templates = [("", False, f" {last}"), (f"{last} ", False, "")]
 
-        # Generate variations for each first name (original + nicknames)
-        for first in first_names:
-            # Basic variations
-            variations.extend(
+        # Handle middle names
+        if parts["middle"]:
+            templates.extend(
                 [
-                    f"{first} {parts['last']}",
-                    f"{parts['last']} {first}",
+                    ("", False, f" {middle} {last}"),
+                    ("", False, f" {parts['middle'][0][0]} {last}"),
+                    ("", True, f" {middle} {last}"),
                 ]
             )
 
-            # Handle middle names
-            if parts["middle"]:
-                variations.extend(
+        # Create variations with prefix/suffix
+        base_variations = [f" {last}"]  # Simple first last
+        if parts["middle"]:
+            base_variations.append(f" {middle} {last}")
+
+        # Add prefix/suffix combinations
+        for base in base_variations:
+            if prefix and suffix:
+                templates.append((f"{prefix} ", False, f"{base} {suffix}"))
+            elif prefix:
+                templates.append((f"{prefix} ", False, base))
+            elif suffix:
+                templates.append(("", False, f"{base} {suffix}"))
+
+        # Additional prefix variations
+        if prefix:
+            if prefix == "Dr":
+                templates.extend(
                     [
-                        f"{first} {' '.join(parts['middle'])} {parts['last']}",
-                        f"{first} {parts['middle'][0][0]} {parts['last']}",
-                        f"{first[0]} {' '.join(parts['middle'])} {parts['last']}",
+                        ("Mr ", False, base_variations[-1]),
+                        ("Mrs ", False, base_variations[-1]),
                     ]
                 )
+            else:
+                templates.append(("Dr ", False, base_variations[-1]))
 
-            # Create variations with prefix/suffix
-            base_variations = [f"{first} {parts['last']}"]  # Simple first last
-            if parts["middle"]:
-                base_variations.append(
-                    f"{first} {' '.join(parts['middle'])} {parts['last']}"
-                )
+        initials: Dict[str, int] = {}
+        for position, first in enumerate(first_names):
+            initials.setdefault(first[:1], position)
+
+        return (
+            tuple(first_names),
+            tuple(dict.fromkeys(templates)),
+            frozenset(initials.values()),
+        )
 
-            # Add prefix/suffix combinations
-            for base in base_variations:
-                if parts["prefix"] and parts["suffix"]:
-                    variations.append(f"{parts['prefix']} {base} {parts['suffix']}")
-                elif parts["prefix"]:
-                    variations.append(f"{parts['prefix']} {base}")
-                elif parts["suffix"]:
-                    variations.append(f"{base} {parts['suffix']}")
-
-            # Additional prefix variations
-            if parts["prefix"]:
-                if parts["prefix"] == "Dr":
-                    variations.extend([f"Mr {base}", f"Mrs {base}"])
-                else:
-                    variations.append(f"Dr {base}")
-
-        # Clean up and deduplicate
-        variations = [" ".join(v.split()) for v in variations]
-        return list(set(variations))
+    @staticmethod
+    def _render_variation(first: str, template: Tuple) -> str:
+        """Fill a first name into a variation template"""
+        before, use_initial, after = template
+        variation = before + (first[:1] if use_initial else first) + after
+        return " ".join(variation.split())
 
     def get_parts(self) -> Dict[str, str]:
         """Split name into prefix, first, middle, last, suffix"""
@@ -192,30 +297,42 @@ class Name(Word):
 
     def reformat(self, text: str) -> str:
         """Format names consistently"""
-        cleaned = "".join(
-            c for c in str(text).upper() if c.isalpha() or c.isspace() or c == ","
-        )
-        cleaned = cleaned.replace(",", " ")
-        return " ".join(cleaned.split())
+        return " ".join(str(text).upper().translate(NAME_CHARS).split())
 
     def mistake(
         self, error_type: Optional[ErrorType] = None, index: Optional[int] = None
     ) -> str:
         """Generate a mistake in the name"""
         if error_type is None:
-            # Get variations if no specific error type
-            variations = self.get_name_variations()
-            if variations:
-                return random.choice(variations)
+            # Pick a name variation if no specific error type
+            return self.sample_variation()
 
         return super().mistake(error_type, index)
 
-    def chaos(self) -> str:
-        """Apply multiple random mistakes to the name"""
-        errors_count = random.randint(1, 6)
-        current_text = self.text
-        for _ in range(errors_count):
-            self.text = self.mistake()
-        result = self.text
-        self.text = current_text  # Restore original text
-        return result
+    def chaos(self, count: Optional[int] = None) -> str:
+        """
+        Apply one name variation, then count - 1 letter mistakes on top of it
+
+        Variations are only drawn once, as a variation of a variation drifts
+        away from the name, such as "Santiago Maria Cruz" ending up as
+        "S Cruz". Later mistakes are Word letter errors instead.
+
+        Args:
+            count: Number of mistakes to apply. If None, 1-6 are chosen randomly
+
+        Returns:
+            The name variation with each letter mistake applied in turn
+        """
+        if count is None:
+            count = self.rand.randint(1, 6)
+        if count < 1:
+            return self.text
+
+        original = self.text
+        try:
+            self.text = self.sample_variation()
+            for _ in range(count - 1):
+                self.text = self.mistake(self.error_table.sample(self.rand))
+            return self.text
+        finally:
+            self.text = original
@@ -1,30 +1,103 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
+from . import vectorized
+from .alias import AliasTable
 from .base import BaseMistaker
 from .constants import ErrorType, MISREAD_NUMBERS, TEN_KEYS
+from .rng import Stream
+from .translate import DIGIT_CHARS
 import random
 
 
 class Number(BaseMistaker):
     """Class for generating number-based mistakes"""
 
+    ERROR_TYPES = (
+        ErrorType.ONE_DIGIT_UP,
+        ErrorType.ONE_DIGIT_DOWN,
+        ErrorType.NUMERIC_KEY_PAD,
+        ErrorType.DIGIT_SHIFT,
+        ErrorType.MISREAD,
+        ErrorType.KEY_SWAP,
+    )
+    error_table = AliasTable(ERROR_TYPES)
+
+    MISTAKES_KEEP_FORMAT = True
+
     def reformat(self, text: str) -> str:
         """Strip everything except digits"""
-        return "".join(c for c in str(text) if c.isdigit())
+        return str(text).translate(DIGIT_CHARS)
+
+    @classmethod
+    def mistake_batch(
+        cls,
+        values: Sequence[str],
+        rands: Sequence[random.Random],
+        counts: Sequence[int],
+        error_table: Optional[AliasTable] = None,
+        **options: Any,
+    ) -> List[Union[str, Exception]]:
+        """
+        Apply chaos(count) to a column of numbers, using NumPy when available
+
+        Number mistakes never change a number's length and draw the same
+        error type and index whatever the digits are. So numbers of equal
+        length with Stream randoms are mistaken together: their draws are
+        taken in bulk and turned into error codes and indexes as arrays, and
+        the digits are changed as a matrix, giving the same strings as the
+        scalar path. Everything else goes one value at a time.
+        """
+        if vectorized.np is None or cls is not Number:
+            return super().mistake_batch(values, rands, counts, error_table, **options)
+
+        formatter = cls()
+        results: List[Union[str, Exception]] = list(values)
+        groups: Dict[int, List[int]] = {}
+        texts: Dict[int, str] = {}
+        scalar: List[int] = []
+
+        for position, (value, rand, count) in enumerate(zip(values, rands, counts)):
+            # chaos(0) hands back the value as given
+            if count == 0:
+                continue
+            text = formatter.reformat(value)
+            if not text:
+                results[position] = text
+            elif text.isascii() and isinstance(rand, Stream):
+                texts[position] = text
+                groups.setdefault(len(text), []).append(position)
+            else:
+                scalar.append(position)
+
+        for positions in groups.values():
+            if len(positions) < vectorized.MIN_BATCH:
+                scalar.extend(positions)
+                continue
+            mistaken = vectorized.number_mistakes(
+                [texts[p] for p in positions],
+                [rands[p] for p in positions],
+                [counts[p] for p in positions],
+                error_table or cls.error_table,
+            )
+            for position, text in zip(positions, mistaken):
+                results[position] = text
+
+        mistaken = super().mistake_batch(
+            [values[p] for p in scalar],
+            [rands[p] for p in scalar],
+            [counts[p] for p in scalar],
+            error_table,
+            **options,
+        )
+        for position, text in zip(scalar, mistaken):
+            results[position] = text
+        return results
 
     @classmethod
-    def make_mistake(cls, text: str) -> str:
+    def make_mistake(cls, text: str, rand: Optional[random.Random] = None) -> str:
         """Class method for one-off mistake generation"""
-        instance = cls(text)
+        instance = cls(text, rand=rand)
         # Force a modification by using a random error type
-        number_errors = [
-            ErrorType.ONE_DIGIT_UP,
-            ErrorType.ONE_DIGIT_DOWN,
-            ErrorType.KEY_SWAP,
-            ErrorType.DIGIT_SHIFT,
-            ErrorType.MISREAD,
-            ErrorType.NUMERIC_KEY_PAD,
-        ]
-        error_type = random.choice(number_errors)
+        error_type = instance.error_table.sample(instance.rand)
         return instance.mistake(error_type)
 
     def mistake(
@@ -40,22 +113,14 @@ class Number(BaseMistaker):
         Returns:
             Modified string with the applied error
         """
-        self.text = self.reformat(self.text)
+        self._reformatted()
         length = len(self.text)
 
         if length == 0:
             return self.text
 
         if error_type is None:
-            number_errors = [
-                ErrorType.ONE_DIGIT_UP,
-                ErrorType.ONE_DIGIT_DOWN,
-                ErrorType.NUMERIC_KEY_PAD,
-                ErrorType.DIGIT_SHIFT,
-                ErrorType.MISREAD,
-                ErrorType.KEY_SWAP,
-            ]
-            error_type = self.rand.choice(number_errors)
+            error_type = self.error_table.sample(self.rand)
 
         if index is None:
             index = self.rand.randint(0, length - 1)
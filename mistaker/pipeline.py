@@ -0,0 +1,140 @@
+from itertools import islice
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, TypeVar
+import queue
+import threading
+
+T = TypeVar("T")
+
+# Chunks a stage may queue up before it waits for the next stage
+DEFAULT_DEPTH = 4
+
+# Seconds a blocked stage waits before checking whether it was cancelled
+_POLL_INTERVAL = 0.1
+
+# Queue item kinds
+_CHUNK, _ERROR, _DONE = range(3)
+
+
+def _put(chunks: queue.Queue, item, stop: threading.Event) -> bool:
+    """Put item on a bounded queue, giving up if stop is set while waiting"""
+    while not stop.is_set():
+        try:
+            chunks.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def read_ahead(
+    items: Iterable[T], chunk_size: int, depth: int = DEFAULT_DEPTH
+) -> Iterator[List[T]]:
+    """
+    Consume items on a background thread, yielding them chunk_size at a time
+
+    At most depth chunks wait in the queue, so a slow consumer stalls the
+    reader instead of letting the input pile up in memory. An error raised
+    while reading is raised again in the consumer. Closing the iterator early
+    stops the reader.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    chunks: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def read() -> None:
+        try:
+            iterator = iter(items)
+            while not stop.is_set():
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                if not _put(chunks, (_CHUNK, chunk), stop):
+                    return
+        except BaseException as e:
+            _put(chunks, (_ERROR, e), stop)
+            return
+        _put(chunks, (_DONE, None), stop)
+
+    reader = threading.Thread(target=read, name="mistaker-reader", daemon=True)
+    reader.start()
+    try:
+        while True:
+            kind, value = chunks.get()
+            if kind == _DONE:
+                return
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        stop.set()
+        reader.join()
+
+
+class ThreadedWriter(Generic[T]):
+    """
+    Hand chunks to write() on a background thread through a bounded queue
+
+    put() blocks once depth chunks are waiting, so a slow output applies
+    backpressure to the producer. The first error raised by write() is raised
+    again from the next put() or from close(). Use as a context manager:
+    leaving the block normally waits for every chunk to be written, while
+    leaving it with an exception drops whatever is still queued.
+    """
+
+    def __init__(self, write: Callable[[List[T]], None], depth: int = DEFAULT_DEPTH):
+        self.write = write
+        self.error: Optional[BaseException] = None
+        self._chunks: queue.Queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="mistaker-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                kind, chunk = self._chunks.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if kind == _DONE:
+                return
+            try:
+                self.write(chunk)
+            except BaseException as e:
+                self.error = e
+                self._stop.set()
+                return
+
+    def put(self, chunk: List[T]) -> None:
+        """Queue a chunk for writing, waiting while the queue is full"""
+        if not _put(self._chunks, (_CHUNK, chunk), self._stop) or self.error:
+            self._raise()
+
+    def close(self) -> None:
+        """Wait for every queued chunk to be written"""
+        _put(self._chunks, (_DONE, None), self._stop)
+        self._thread.join()
+        if self.error is not None:
+            self._raise()
+
+    def abort(self) -> None:
+        """Stop writing, dropping any chunks still queued"""
+        self._stop.set()
+        self._thread.join()
+
+    def _raise(self) -> None:
+        if self.error is None:
+            raise RuntimeError("Writer was stopped")
+        raise self.error
+
+    def __enter__(self) -> "ThreadedWriter[T]":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
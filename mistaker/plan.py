@@ -0,0 +1,170 @@
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Type
+import sys
+from .alias import AliasTable
+from .base import BaseMistaker
+from .rng import stream, field_key
+
+
+class PlanStep(NamedTuple):
+    """Everything needed to mistake one column, resolved ahead of time"""
+
+    index: int
+    field: str
+    key: int
+    mistaker: Type[BaseMistaker]
+    error_table: Optional[AliasTable]
+    missing_weight: float
+    mistake_weight: float
+    min_chaos: int
+    max_chaos: int
+    # Keyword arguments for the column's mistakers: the field's options from
+    # the generator, then column_options()
+    options: Dict[str, Any]
+
+
+class MistakePlan:
+    """
+    Per-column mistake steps compiled once from a config and a header row
+
+    Only supported columns get a step, so applying the plan to a row does no
+    field dispatch, membership checks or config lookups. Anything a mistaker
+    works out per column, such as a date column's format, comes from the
+    sample rows given when the plan is compiled.
+    """
+
+    def __init__(
+        self,
+        config: Dict,
+        fieldnames: Iterable[str],
+        mistakers: Dict[str, Type[BaseMistaker]],
+        error_tables: Optional[Dict[str, AliasTable]] = None,
+        sample: Sequence[Sequence[str]] = (),
+        field_options: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        error_tables = error_tables or {}
+        field_options = field_options or {}
+        self.fieldnames = tuple(fieldnames)
+        self.steps = tuple(
+            PlanStep(
+                index,
+                field,
+                field_key(field),
+                mistakers[field],
+                error_tables.get(field),
+                config["missing_weights"].get(field, 0.1),
+                config["mistake_weights"].get(field, 1.0),
+                config["min_chaos"],
+                config["max_chaos"],
+                {
+                    **field_options.get(field, {}),
+                    **mistakers[field].column_options([row[index] for row in sample]),
+                },
+            )
+            for index, field in enumerate(self.fieldnames)
+            if field in mistakers
+        )
+
+    def apply(self, row: List[str], seed: int, index: int, duplicate: int) -> List[str]:
+        """
+        Make mistakes in a row of values laid out like fieldnames, in place
+
+        Args:
+            row: Values in header order
+            seed: Generator seed
+            index: Position of the record in the input
+            duplicate: Which duplicate of the record this is (1-based)
+
+        Returns:
+            The same row list, with mistaken or blanked values
+        """
+        for (
+            column,
+            field,
+            key,
+            mistaker,
+            error_table,
+            missing_weight,
+            mistake_weight,
+            low,
+            high,
+            options,
+        ) in self.steps:
+            value = row[column]
+            rand = stream(seed, index, duplicate, key)
+            if not value or rand.random() < missing_weight:
+                row[column] = ""
+                continue
+
+            # Untouched values are kept as-is without building a mistaker
+            if mistake_weight < 1.0 and rand.random() >= mistake_weight:
+                continue
+
+            try:
+                row[column] = mistaker(
+                    value, rand=rand, error_table=error_table, **options
+                ).chaos(rand.randint(low, high))
+            except (ValueError, AttributeError) as e:
+                print(
+                    f"Warning: Error processing field {field}: {str(e)}",
+                    file=sys.stderr,
+                )
+
+        return row
+
+    def apply_column(
+        self,
+        step: PlanStep,
+        values: Sequence[str],
+        seed: int,
+        indexes: Sequence[int],
+        duplicates: Sequence[int],
+    ) -> List[str]:
+        """
+        Make one step's mistakes down a whole column
+
+        Draws come from the same per-value streams as apply(), so the column
+        matches what row-at-a-time processing would produce.
+
+        Args:
+            step: The step for this column
+            values: Column values, one per output row
+            seed: Generator seed
+            indexes: Input position of the record behind each row
+            duplicates: Duplicate number of each row; 0 marks an original,
+                which is passed through unchanged
+
+        Returns:
+            A new list of mistaken, blanked or untouched values
+        """
+        result = list(values)
+        positions, batch, rands, counts = [], [], [], []
+
+        for position, (value, index, duplicate) in enumerate(
+            zip(values, indexes, duplicates)
+        ):
+            if duplicate == 0:
+                continue
+            rand = stream(seed, index, duplicate, step.key)
+            if not value or rand.random() < step.missing_weight:
+                result[position] = ""
+                continue
+            if step.mistake_weight < 1.0 and rand.random() >= step.mistake_weight:
+                continue
+            positions.append(position)
+            batch.append(value)
+            rands.append(rand)
+            counts.append(rand.randint(step.min_chaos, step.max_chaos))
+
+        mistaken = step.mistaker.mistake_batch(
+            batch, rands, counts, step.error_table, **step.options
+        )
+        for position, value in zip(positions, mistaken):
+            if isinstance(value, Exception):
+                print(
+                    f"Warning: Error processing field {step.field}: {str(value)}",
+                    file=sys.stderr,
+                )
+                continue
+            result[position] = value
+
+        return result
@@ -0,0 +1,142 @@
+from functools import partial
+from hashlib import blake2b
+from itertools import chain, count, islice
+from operator import sub
+from typing import Iterator, List, Optional
+import random
+import struct
+import zlib
+
+_MASK64 = (1 << 64) - 1
+
+# Draws come eight at a time from one 64-byte BLAKE2b digest. Each 64-bit
+# word keeps its low 52 bits as the mantissa of a double in [1, 2), which
+# minus one is a float in [0, 1)
+_WORDS = 8
+_MANTISSAS = int.from_bytes(struct.pack("<8Q", *[(1 << 52) - 1] * _WORDS), "little")
+_EXPONENTS = int.from_bytes(struct.pack("<8Q", *[0x3FF << 52] * _WORDS), "little")
+_DOUBLES = struct.Struct("<8d").unpack
+_BLOCK_INDEX = struct.Struct("<Q").pack
+_ONES = (1.0,) * _WORDS
+
+# Each draw holds 52 random bits; wider ranges fall back to getrandbits()
+DRAW_BITS = 52
+_DRAW_RANGE = 1 << DRAW_BITS
+
+_PACKERS = {}
+
+
+def _pack(words) -> bytes:
+    """Pack integers as little-endian 64-bit words"""
+    packer = _PACKERS.get(len(words))
+    if packer is None:
+        packer = _PACKERS[len(words)] = struct.Struct(f"<{len(words)}Q").pack
+    return packer(*[word & _MASK64 for word in words])
+
+
+def derive_seed(seed: int, *counters: int) -> int:
+    """
+    Derive an independent 64-bit seed from a global seed and a tuple of counters
+
+    The result depends only on its arguments, so any (record, duplicate, field)
+    stream can be recreated without replaying the streams that came before it.
+    """
+    digest = blake2b(_pack((seed,) + counters), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _block(key: bytes, index: int) -> Iterator[float]:
+    """The eight draws of block index of the stream for key"""
+    digest = blake2b(key + _BLOCK_INDEX(index), digest_size=64).digest()
+    words = int.from_bytes(digest, "little")
+    doubles = ((words & _MANTISSAS) | _EXPONENTS).to_bytes(64, "little")
+    return map(sub, _DOUBLES(doubles), _ONES)
+
+
+class Stream(random.Random):
+    """
+    Counter-based random stream for a seed and a tuple of counters
+
+    Draw k is word k % 8 of the BLAKE2b digest of (seed, counters..., k // 8),
+    so a stream depends only on its key, like the Mersenne Twister seeded
+    from derive_seed() it replaces, but costs a hash instead of a 2.5 KB
+    state to set up. random() is a C-level iterator over those draws, so a
+    draw does not pay for a Python call either.
+
+    Every draw is one float: randint(), choice() and the other integer draws
+    scale it instead of rejection sampling, so draw k of a stream is always
+    its k-th call, and take() can hand a run of draws to NumPy to be turned
+    into the same floats and integers a column at a time.
+
+    Streams are not meant to be saved: getstate() and setstate() are not
+    supported, as the same stream can be had again from its key.
+    """
+
+    def __init__(self, *key: int):
+        # Random.__init__ would only call seed(); skipping it keeps creating
+        # a stream as cheap as possible
+        if not key:
+            key = (random.getrandbits(64),)
+        self._draws = chain.from_iterable(map(partial(_block, _pack(key)), count()))
+        self.random = self._draws.__next__
+        self.gauss_next = None
+
+    def seed(self, a: Optional[int] = None, version: int = 2) -> None:
+        """Restart as the stream for seed a, or for a random seed if None"""
+        if a is None:
+            self.__init__()
+        else:
+            self.__init__(a)
+
+    def getstate(self):
+        raise NotImplementedError("Create the Stream again from its key instead")
+
+    def setstate(self, state) -> None:
+        raise NotImplementedError("Create the Stream again from its key instead")
+
+    def random(self) -> float:
+        """Next float in [0, 1); replaced on each instance by its draws"""
+        return next(self._draws)
+
+    def take(self, count: int) -> List[float]:
+        """The next count draws, as random() would have returned them"""
+        return list(islice(self._draws, count))
+
+    def _randbelow(self, n: int) -> int:
+        if n <= 0:
+            raise ValueError("empty range")
+        if n > _DRAW_RANGE:
+            return self._randbelow_with_getrandbits(n)
+        return int(self.random() * n)
+
+    def randint(self, a: int, b: int) -> int:
+        """Random integer in [a, b], from a single draw"""
+        n = b - a + 1
+        if 0 < n <= _DRAW_RANGE:
+            return a + int(self.random() * n)
+        return a + self._randbelow(n)
+
+    def choice(self, seq):
+        """Random element of a non-empty sequence, from a single draw"""
+        if not len(seq):
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[int(self.random() * len(seq))]
+
+    def getrandbits(self, k: int) -> int:
+        """Integer with k random bits, from ceil(k / 52) draws"""
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        bits = 0
+        for draw in self.take(-(-k // DRAW_BITS)):
+            bits = (bits << DRAW_BITS) | int(draw * _DRAW_RANGE)
+        return bits >> (-k % DRAW_BITS)
+
+
+def stream(seed: int, *counters: int) -> Stream:
+    """Return a Stream positioned at the start of the given stream"""
+    return Stream(seed, *counters)
+
+
+def field_key(field: str) -> int:
+    """Stable integer key for a field name, independent of hash randomization"""
+    return zlib.crc32(field.encode("utf-8"))
@@ -0,0 +1,33 @@
+from typing import Callable, Dict, Optional
+
+
+class CharTable(Dict[int, Optional[str]]):
+    """
+    str.translate table that works out what to do with each character the
+    first time it is seen
+
+    ``convert`` maps a character to its replacement, or to None to delete it.
+    Results are stored in the table, so translate() runs at C speed for every
+    character after the first occurrence.
+    """
+
+    def __init__(self, convert: Callable[[str], Optional[str]]):
+        super().__init__()
+        self.convert = convert
+
+    def __missing__(self, code: int) -> Optional[str]:
+        value = self.convert(chr(code))
+        self[code] = value
+        return value
+
+
+# Letters and whitespace, as kept by Word.reformat
+WORD_CHARS = CharTable(lambda c: c if c.isalpha() or c.isspace() else None)
+
+# Letters and whitespace, with commas turned into spaces, as kept by Name.reformat
+NAME_CHARS = CharTable(
+    lambda c: " " if c == "," else c if c.isalpha() or c.isspace() else None
+)
+
+# Digits, as kept by Number.reformat
+DIGIT_CHARS = CharTable(lambda c: c if c.isdigit() else None)
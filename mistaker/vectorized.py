@@ -0,0 +1,313 @@
+"""
+NumPy kernels that make the same mistakes as the scalar mistakers, a whole
+column at a time
+
+NumPy is optional. Without it ``np`` is None and mistakers keep working one
+value at a time.
+"""
+
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Tuple
+from .alias import AliasTable
+from .constants import ErrorType, MISREAD_NUMBERS, TEN_KEYS
+from .rng import Stream
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Smallest group worth building arrays for; below this the scalar path wins
+MIN_BATCH = 32
+
+_NO_ERROR = -1
+
+
+def draw_steps(
+    rands: Sequence[Stream],
+    counts: Sequence[int],
+    error_table: AliasTable,
+    error_codes: Dict[ErrorType, int],
+    size: int,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Draw every row's mistakes at once, as the scalar mistakers would draw them
+
+    A scalar mistake takes two draws from its stream: the error type from
+    error_table, then an argument below size with randint() or choice().
+    Every Stream draw is a single float, so one take() per row gets all of
+    a row's draws, and the alias lookups and scaling are array arithmetic.
+
+    Args:
+        rands: Stream of each row
+        counts: Number of mistakes to draw for each row
+        error_table: Table the error types are drawn from
+        error_codes: Kernel code of each error type it handles
+        size: Number of values the argument is drawn from
+
+    Returns:
+        (codes, arguments), each (rows, largest count); steps past a row's
+        count are no-ops
+    """
+    rounds = max(counts, default=0)
+    flat = np.fromiter(
+        chain.from_iterable(rand.take(2 * count) for rand, count in zip(rands, counts)),
+        dtype=np.float64,
+        count=2 * sum(counts),
+    )
+    filled = np.arange(rounds) < np.asarray(counts, dtype=np.intp)[:, None]
+    draws = np.zeros((len(rands), rounds, 2))
+    draws[filled] = flat.reshape(-1, 2)
+
+    # AliasTable.sample_index on every first draw
+    position = draws[..., 0] * len(error_table)
+    column = position.astype(np.intp)
+    prob = np.array(error_table.prob)
+    alias = np.array(error_table.alias, dtype=np.intp)
+    picked = np.where(position - column < prob[column], column, alias[column])
+    table_codes = np.array(
+        [error_codes.get(item, _NO_ERROR) for item in error_table.items],
+        dtype=np.int8,
+    )
+    codes = np.where(filled, table_codes[picked], _NO_ERROR).astype(np.int8)
+    arguments = (draws[..., 1] * size).astype(np.intp)
+    return codes, arguments
+
+
+_NUMBER_CODES = {
+    ErrorType.ONE_DIGIT_UP: 0,
+    ErrorType.ONE_DIGIT_DOWN: 1,
+    ErrorType.KEY_SWAP: 2,
+    ErrorType.NUMERIC_KEY_PAD: 3,
+    ErrorType.DIGIT_SHIFT: 4,
+    ErrorType.MISREAD: 5,
+}
+
+if np is not None:
+    _TEN_KEYS = np.array([int(TEN_KEYS[str(d)]) for d in range(10)], dtype=np.uint8)
+    _MISREAD_NUMBERS = np.array(
+        [int(MISREAD_NUMBERS[str(d)]) for d in range(10)], dtype=np.uint8
+    )
+
+
+def number_mistakes(
+    texts: Sequence[str],
+    rands: Sequence[Stream],
+    counts: Sequence[int],
+    error_table: AliasTable,
+) -> List[str]:
+    """
+    Apply chaos(count) Number mistakes to equal-length ASCII digit strings
+
+    Args:
+        texts: Digit strings, all the same non-zero length
+        rands: Stream of each text
+        counts: Number of mistakes to make in each text
+        error_table: Table the error types are drawn from
+
+    Returns:
+        The mistaken strings, identical to Number.chaos() with each stream
+    """
+    codes, indexes = draw_steps(
+        rands, counts, error_table, _NUMBER_CODES, len(texts[0])
+    )
+    return digit_mistakes(texts, codes, indexes)
+
+
+def digit_mistakes(
+    texts: Sequence[str], codes: "np.ndarray", indexes: "np.ndarray"
+) -> List[str]:
+    """
+    Apply drawn Number mistakes to equal-length ASCII digit strings
+
+    Args:
+        texts: Digit strings, all the same non-zero length
+        codes: (texts, rounds) kernel codes of the error types, in order
+        indexes: (texts, rounds) digit index of each mistake
+
+    Returns:
+        The mistaken strings
+    """
+    count = len(texts)
+    length = len(texts[0])
+    rounds = codes.shape[1]
+
+    digits = np.frombuffer("".join(texts).encode("ascii"), dtype=np.uint8)
+    digits = (digits - ord("0")).reshape(count, length)
+
+    positions = np.arange(length)
+    for round_ in range(rounds):
+        code = codes[:, round_]
+        index = indexes[:, round_]
+
+        rows = np.flatnonzero(code == 0)
+        digits[rows, index[rows]] = (digits[rows, index[rows]] + 1) % 10
+
+        rows = np.flatnonzero(code == 1)
+        digits[rows, index[rows]] = (digits[rows, index[rows]] + 9) % 10
+
+        rows = np.flatnonzero(code == 2)
+        if length >= 2 and rows.size:
+            cols = index[rows]
+            prev = np.abs(cols - 1)
+            swapped = digits[rows, cols]
+            digits[rows, cols] = digits[rows, prev]
+            digits[rows, prev] = swapped
+
+        rows = np.flatnonzero(code == 3)
+        digits[rows, index[rows]] = _TEN_KEYS[digits[rows, index[rows]]]
+
+        rows = np.flatnonzero(code == 4)
+        if rows.size:
+            # Shift right by index, padding with zeros on the left
+            source = positions - index[rows, None]
+            shifted = np.take_along_axis(digits[rows], np.maximum(source, 0), axis=1)
+            digits[rows] = np.where(source >= 0, shifted, 0)
+
+        rows = np.flatnonzero(code == 5)
+        digits[rows, index[rows]] = _MISREAD_NUMBERS[digits[rows, index[rows]]]
+
+    joined = (digits + ord("0")).astype(np.uint8).tobytes().decode("ascii")
+    return [joined[i : i + length] for i in range(0, count * length, length)]
+
+
+_DATE_CODES = {
+    ErrorType.ONE_DIGIT_UP: 0,
+    ErrorType.ONE_DIGIT_DOWN: 1,
+    ErrorType.KEY_SWAP: 2,
+    ErrorType.ONE_DECADE_DOWN: 3,
+    ErrorType.Y2K: 4,
+    ErrorType.MONTH_DAY_SWAP: 5,
+    ErrorType.MISREAD: 6,
+    ErrorType.NUMERIC_KEY_PAD: 7,
+    ErrorType.DIGIT_SHIFT: 8,
+}
+
+
+def date_mistakes(
+    dates: Sequence[Tuple[int, int, int]],
+    codes: "np.ndarray",
+    parts: "np.ndarray",
+) -> Tuple[List[Optional[str]], Dict[int, Tuple[int, Tuple[int, int, int]]]]:
+    """
+    Apply Date mistakes to (year, month, day) triples with masked array updates
+
+    Year digit errors assume a four-digit year, so a row whose year passes
+    9999 is frozen at that point and handed back for the scalar code to
+    finish. Years never go below zero.
+
+    Args:
+        dates: Parsed (year, month, day) per row
+        codes: (rows, rounds) kernel codes of the error types, in order
+        parts: (rows, rounds) date part of each mistake
+
+    Returns:
+        (texts, escaped): texts holds the YYYY-MM-DD result of each row, or
+        None for rows in escaped, which maps row -> (rounds applied,
+        (year, month, day))
+    """
+    count = len(dates)
+    rounds = codes.shape[1]
+    year, month, day = (np.array(part, dtype=np.int64) for part in zip(*dates))
+
+    active = (year >= 0) & (year <= 9999)
+    escaped_at = np.where(active, -1, 0)
+
+    for round_ in range(rounds):
+        code = np.where(active, codes[:, round_], _NO_ERROR)
+        is_year = parts[:, round_] == 0
+        is_month = parts[:, round_] == 1
+        is_day = parts[:, round_] == 2
+
+        # ONE_DIGIT_UP
+        sel = code == 0
+        year = np.where(sel & is_year, year + 1, year)
+        month = np.where(sel & is_month, month % 12 + 1, month)
+        day = np.where(sel & is_day, day % 31 + 1, day)
+
+        # ONE_DIGIT_DOWN
+        sel = code == 1
+        year = np.where(sel & is_year & (year > 0), year - 1, year)
+        month = np.where(sel & is_month, (month - 2) % 12 + 1, month)
+        day = np.where(sel & is_day, (day - 2) % 31 + 1, day)
+
+        # KEY_SWAP: swap the last two digits of the year, reverse month or day
+        sel = code == 2
+        swapped_year = year // 100 * 100 + year % 10 * 10 + year // 10 % 10
+        year = np.where(sel & is_year, swapped_year, year)
+        month = np.where(sel & is_month, month % 10 * 10 + month // 10, month)
+        day = np.where(sel & is_day, day % 10 * 10 + day // 10, day)
+
+        # ONE_DECADE_DOWN
+        year = np.where((code == 3) & (year >= 10), year - 10, year)
+
+        # Y2K
+        sel = code == 4
+        year = np.where(
+            sel, np.where(year >= 2000, year % 100, 2000 + year % 100), year
+        )
+
+        # MONTH_DAY_SWAP
+        sel = code == 5
+        month, day = np.where(sel, day, month), np.where(sel, month, day)
+
+        # MISREAD: tens digit of the year, last digit of month or day
+        sel = code == 6
+        tens = year // 10 % 10
+        year = np.where(
+            sel & is_year, year + (_MISREAD_NUMBERS[tens] - tens) * 10, year
+        )
+        month = np.where(
+            sel & is_month, month - month % 10 + _MISREAD_NUMBERS[month % 10], month
+        )
+        day = np.where(sel & is_day, day - day % 10 + _MISREAD_NUMBERS[day % 10], day)
+
+        # NUMERIC_KEY_PAD: last digit of the year, month or day
+        sel = code == 7
+        year = np.where(sel & is_year, year - year % 10 + _TEN_KEYS[year % 10], year)
+        month = np.where(
+            sel & is_month, month - month % 10 + _TEN_KEYS[month % 10], month
+        )
+        day = np.where(sel & is_day, day - day % 10 + _TEN_KEYS[day % 10], day)
+
+        # DIGIT_SHIFT: YYYY-MM-DD becomes YY-(year's last two digits)-MM
+        sel = code == 8
+        day = np.where(sel, month, day)
+        month = np.where(sel, year % 100, month)
+        year = np.where(sel, year // 100, year)
+
+        leaving = active & (year > 9999)
+        escaped_at[leaving] = round_ + 1
+        active &= ~leaving
+
+    # Format all in-range rows at once as YYYY-MM-DD bytes
+    chars = np.empty((count, 10), dtype=np.uint8)
+    for column, (values, divisor) in enumerate(
+        [
+            (year, 1000),
+            (year, 100),
+            (year, 10),
+            (year, 1),
+            (None, 0),
+            (month, 10),
+            (month, 1),
+            (None, 0),
+            (day, 10),
+            (day, 1),
+        ]
+    ):
+        if values is None:
+            chars[:, column] = ord("-")
+        else:
+            chars[:, column] = values // divisor % 10 + ord("0")
+    joined = chars.tobytes().decode("ascii")
+
+    texts: List[Optional[str]] = [joined[i : i + 10] for i in range(0, count * 10, 10)]
+    escaped = {}
+    for row in np.flatnonzero(~active).tolist():
+        texts[row] = None
+        escaped[row] = (
+            int(escaped_at[row]),
+            (int(year[row]), int(month[row]), int(day[row])),
+        )
+    return texts, escaped
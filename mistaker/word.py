@@ -1,5 +1,7 @@
 from typing import Optional
+from .alias import AliasTable
 from .base import BaseMistaker
+from .translate import WORD_CHARS
 from .constants import (
     ErrorType,
     MISREAD_LETTERS,
@@ -12,6 +14,18 @@ from .constants import (
 class Word(BaseMistaker):
     """Class for generating word-based mistakes"""
 
+    ERROR_TYPES = (
+        ErrorType.DROPPED_LETTER,
+        ErrorType.DOUBLE_LETTER,
+        ErrorType.MISREAD_LETTER,
+        ErrorType.MISTYPED_LETTER,
+        ErrorType.EXTRA_LETTER,
+        ErrorType.MISHEARD_LETTER,
+    )
+    error_table = AliasTable(ERROR_TYPES)
+
+    MISTAKES_KEEP_FORMAT = True
+
     def reformat(self, text: str) -> str:
         """Convert text to uppercase and remove non-alpha characters except spaces"""
         # Handle invalid input types by converting to string
@@ -26,7 +40,7 @@ class Word(BaseMistaker):
         if not text_str or text_str.isspace():
             return text_str
 
-        return "".join(c for c in text_str.upper() if c.isalpha() or c.isspace())
+        return text_str.upper().translate(WORD_CHARS)
 
     def mistake(
         self, error_type: Optional[ErrorType] = None, index: Optional[int] = None
@@ -46,7 +60,7 @@ class Word(BaseMistaker):
             return ""
 
         try:
-            self.text = self.reformat(self.text)
+            self._reformatted()
         except (ValueError, TypeError):
             return ""
 
@@ -56,15 +70,7 @@ class Word(BaseMistaker):
             return ""
 
         if error_type is None:
-            word_errors = [
-                ErrorType.DROPPED_LETTER,
-                ErrorType.DOUBLE_LETTER,
-                ErrorType.MISREAD_LETTER,
-                ErrorType.MISTYPED_LETTER,
-                ErrorType.EXTRA_LETTER,
-                ErrorType.MISHEARD_LETTER,
-            ]
-            error_type = self.rand.choice(word_errors)
+            error_type = self.error_table.sample(self.rand)
 
         if index is None:
             index = self.rand.randint(0, length - 1)
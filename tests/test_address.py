@@ -106,7 +106,7 @@ def test_address_zip_calls_number_mistaker():
         address.make_mistake("zip")
 
         # Verify Number.make_mistake was called with the zip code
-        mock_number.assert_called_once_with("80202")
+        mock_number.assert_called_once_with("80202", rand=address.rand)
 
 
 def test_address_street_number_calls_number_mistaker():
@@ -118,7 +118,7 @@ def test_address_street_number_calls_number_mistaker():
         address.make_mistake("street_number")
 
         # Verify Number.make_mistake was called with the street number
-        mock_number.assert_called_once_with("123")
+        mock_number.assert_called_once_with("123", rand=address.rand)
 
 
 def test_unit_id_numeric_part_calls_number_mistaker():
@@ -130,7 +130,7 @@ def test_unit_id_numeric_part_calls_number_mistaker():
         address.make_mistake("unit_id")
 
         # Verify Number.make_mistake was called with just the numeric part
-        mock_number.assert_called_once_with("101")
+        mock_number.assert_called_once_with("101", rand=address.rand)
 
     # Test that the alpha portion is preserved
     with mock.patch("mistaker.number.Number.make_mistake") as mock_number:
@@ -180,10 +180,9 @@ def test_street_direction_mistakes():
         "SOUTH-EAST",
     ]
 
-    # Mock random.random() to test each case
-    with mock.patch("random.random") as mock_random:
-        address = Address("123 North Main St")
-
+    # Mock the address's random.random() to test each case
+    address = Address("123 North Main St")
+    with mock.patch.object(address.rand, "random") as mock_random:
         # Test skip direction (first quarter)
         mock_random.return_value = 0.1  # in first quarter
         result = address.make_mistake("street_direction")
@@ -224,7 +223,7 @@ def test_building_name_and_city_use_word_mistaker():
         # Test city - should make mistake 30% of the time
         mock_word.return_value = "CHICACO"  # CHICAGO -> CHICACO
 
-        with mock.patch("random.random") as mock_random:
+        with mock.patch.object(address.rand, "random") as mock_random:
             # Test when random is under 0.3 - should make mistake
             mock_random.return_value = 0.2
             result = address.make_mistake("city")
@@ -241,10 +240,10 @@ def test_building_name_and_city_use_word_mistaker():
 
 def test_state_mistakes():
     """Test that state can be omitted"""
-    with mock.patch("random.random") as mock_random:
+    address = Address("123 Main St, Denver, CO 80202")
+    with mock.patch.object(address.rand, "random") as mock_random:
         # Test omitting state (25% chance)
         mock_random.return_value = 0.2
-        address = Address("123 Main St, Denver, CO 80202")
         result = address.make_mistake("state")
         assert "123 Main St, Denver, 80202" in result
 
@@ -256,9 +255,8 @@ def test_state_mistakes():
 
 def test_street_type_mistakes():
     """Test that street_type can be swapped with alternatives"""
-    with mock.patch("random.random") as mock_random:
-        address = Address("123 Main Street, Denver, CO 80202")
-
+    address = Address("123 Main Street, Denver, CO 80202")
+    with mock.patch.object(address.rand, "random") as mock_random:
         # Test swapping with variation (30% chance)
         mock_random.return_value = 0.2
         result = address.make_mistake("street_type")
@@ -288,9 +286,8 @@ def test_street_type_mistakes():
 
 def test_unit_type_mistakes():
     """Test that unit_type has correct error probabilities"""
-    with mock.patch("random.random") as mock_random:
-        address = Address("123 Main St, Apartment 4B, Denver, CO 80202")
-
+    address = Address("123 Main St, Apartment 4B, Denver, CO 80202")
+    with mock.patch.object(address.rand, "random") as mock_random:
         # Test random different unit type (25% chance)
         mock_random.return_value = 0.1
         result = address.make_mistake("unit_type")
@@ -348,3 +345,66 @@ def test_mistake_maintains_full_address():
 
         # Check length is reasonable (not just a component)
         assert len(result) > 10, f"Result too short: {result}"
+
+
+def test_mistake_parses_once():
+    """Test that mistake() tags the address a single time"""
+    Address.parse_cache.clear()
+    with mock.patch("usaddress.parse", wraps=usaddress.parse) as mock_parse:
+        Address("123 N Main St Suite 456 Denver, CO 80202").mistake()
+        assert mock_parse.call_count == 1
+
+
+def test_parse_cache_reuses_results():
+    """Test that repeated addresses are served from the parse cache"""
+    Address.parse_cache.clear()
+    with mock.patch("usaddress.parse", wraps=usaddress.parse) as mock_parse:
+        Address("123 N Main St Denver, CO 80202").mistake()
+        Address("123 N Main St Denver, CO 80202").mistake()
+        Address("123  N Main St   Denver, CO 80202").parse()  # Same tokens
+        assert mock_parse.call_count == 1
+
+    info = Address.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.currsize == 1
+
+
+def test_make_mistake_only_edits_component_span():
+    """Test that edits land on the component, not on matching text elsewhere"""
+    with mock.patch("mistaker.number.Number.make_mistake") as mock_number:
+        mock_number.return_value = "999"
+
+        address = Address("123 Main St, Denver CO 80123")
+        result = address.make_mistake("street_number")
+
+        assert result == "999 Main St, Denver CO 80123"
+
+
+def test_parse_spans_locate_components():
+    """Test that component spans point at the text as written"""
+    address = Address("1234 Northeast MLK Jr Blvd #505 Portland, OR 97232")
+    spans = address._parse_spans()
+
+    for part, expected in [
+        ("street_direction", "Northeast"),
+        ("street_name", "MLK Jr"),
+        ("unit_type", "#"),
+        ("unit_id", "505"),
+        ("city", "Portland"),
+    ]:
+        _, start, end = spans[part]
+        assert address.text[start:end] == expected
+
+
+def test_chaos_compounds_on_one_parse():
+    """Test that chaos() applies several rounds from a single parse"""
+    address = Address("123 N Main St Suite 456 Denver, CO 80202", rand=random.Random(1))
+    with mock.patch.object(
+        Address, "_parse_spans", autospec=True, side_effect=Address._parse_spans
+    ) as parse_spans:
+        result = address.chaos(4)
+        assert parse_spans.call_count == 1
+
+    assert result != address.text
+    assert address.text == "123 N Main St Suite 456 Denver, CO 80202"
@@ -0,0 +1,53 @@
+import random
+from collections import Counter
+import pytest
+from mistaker.alias import AliasTable
+
+
+def test_uniform_by_default():
+    table = AliasTable("abcd")
+    assert table.prob == [1.0] * 4
+    rand = random.Random(1)
+    counts = Counter(table.sample(rand) for _ in range(4000))
+    assert set(counts) == set("abcd")
+    assert all(800 < n < 1200 for n in counts.values())
+
+
+def test_follows_weights():
+    table = AliasTable(["x", "y", "z"], [6, 3, 1])
+    rand = random.Random(2)
+    counts = Counter(table.sample(rand) for _ in range(20000))
+    assert 11400 < counts["x"] < 12600
+    assert 5400 < counts["y"] < 6600
+    assert 1600 < counts["z"] < 2400
+
+
+def test_zero_weight_never_drawn():
+    table = AliasTable(["x", "y"], [0, 1])
+    rand = random.Random(3)
+    assert {table.sample(rand) for _ in range(1000)} == {"y"}
+
+
+def test_one_draw_per_sample():
+    table = AliasTable(["x", "y", "z"], [1, 2, 3])
+    rand = random.Random(4)
+    table.sample(rand)
+    expected = random.Random(4)
+    expected.random()
+    assert rand.random() == expected.random()
+
+
+@pytest.mark.parametrize(
+    "items,weights",
+    [([], None), (["x"], [1, 2]), (["x", "y"], [1, -1]), (["x", "y"], [0, 0])],
+)
+def test_invalid_tables(items, weights):
+    with pytest.raises(ValueError):
+        AliasTable(items, weights)
+
+
+def test_sample_index_matches_sample():
+    table = AliasTable(["x", "y", "z"], [1, 2, 3])
+    first, second = random.Random(5), random.Random(5)
+    for _ in range(100):
+        assert table.items[table.sample_index(first)] == table.sample(second)
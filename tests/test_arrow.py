@@ -0,0 +1,162 @@
+# tests/test_arrow.py
+import csv
+import datetime
+import io
+import pytest
+from mistaker import Generator
+from mistaker import arrow, cli
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+RECORDS = {
+    "full_name": ["John Smith", "Jane Doe", None, "Bob Jones"] * 5,
+    "dob": ["1980-01-02", "12/5/1990", "", "2001-07-04"] * 5,
+    "phone": ["5551234567", "5559876543", "5550001111", ""] * 5,
+    "note": ["a, b", "café", None, ""] * 5,
+}
+
+
+def string_table():
+    return pa.table({field: pa.array(v, pa.string()) for field, v in RECORDS.items()})
+
+
+class FakeStdout:
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+
+def run_cli(monkeypatch, input_file, **kwargs):
+    stdout = FakeStdout()
+    monkeypatch.setattr(cli.sys, "stdout", stdout)
+    cli.process_file(Generator(seed=4), input_file, chunk_size=7, **kwargs)
+    return stdout.buffer.getvalue()
+
+
+def test_detect_format():
+    assert arrow.detect_format("data.parquet") == "parquet"
+    assert arrow.detect_format("data.ARROW") == "arrow"
+    assert arrow.detect_format("data.feather") == "arrow"
+    assert arrow.detect_format("data.csv") == "csv"
+    assert arrow.detect_format("data") == "csv"
+
+
+def test_record_batch_matches_generate_batch():
+    """Test that Arrow batches give the same rows as Python columns"""
+    columns = {field: [v or "" for v in values] for field, values in RECORDS.items()}
+    expected, _ = Generator(seed=8).generate_batch(columns)
+
+    batch = string_table().to_batches()[0]
+    output = Generator(seed=8).generate_record_batch(batch).to_pydict()
+    assert {f: [v or "" for v in values] for f, values in output.items()} == expected
+
+
+def test_record_batch_keeps_nulls():
+    """Test that null and blanked values come out as nulls, not empty strings"""
+    columns = {
+        "full_name": [None, "John Smith"] * 10,
+        "phone": ["5551234567", None] * 10,
+    }
+    batch = pa.record_batch(
+        {field: pa.array(values, pa.string()) for field, values in columns.items()}
+    )
+    output = Generator(seed=3).generate_record_batch(batch).to_pydict()
+    expected, _ = Generator(seed=3).generate_batch(
+        {field: [v or "" for v in values] for field, values in columns.items()}
+    )
+    for field, values in expected.items():
+        assert "" not in output[field]
+        assert output[field] == [v or None for v in values]
+        assert "" in values
+
+
+def test_record_batch_keeps_pass_through_columns():
+    """Test that columns without mistakes keep their Arrow type and values"""
+    batch = pa.record_batch(
+        {
+            "dob": pa.array([datetime.date(1980, 1, 2)] * 3, pa.date32()),
+            "score": pa.array([1, None, 3], pa.int64()),
+        }
+    )
+    output = Generator(seed=2).generate_record_batch(batch)
+    assert output.schema.field("dob").type == pa.string()
+    assert output.schema.field("score").type == pa.int64()
+    assert output.column(0)[0].as_py() == "1980-01-02"
+    assert set(output.column(1).to_pylist()) == {1, None, 3}
+
+
+def test_record_batches_continue_index():
+    """Test that consecutive batches use consecutive record positions"""
+    table = string_table()
+    whole = Generator(seed=5).generate_record_batch(table.to_batches()[0])
+    generator = Generator(seed=5)
+    parts = [
+        generator.generate_record_batch(batch)
+        for batch in table.to_batches(max_chunksize=6)
+    ]
+    assert pa.Table.from_batches(parts).equals(pa.Table.from_batches([whole]))
+
+
+def test_formats_give_the_same_rows(monkeypatch, tmp_path):
+    """Test CSV, Parquet and Arrow input and output against each other"""
+    table = string_table()
+    csv_path = tmp_path / "input.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(table.column_names)
+        writer.writerows(arrow.batch_to_rows(table.to_batches()[0]))
+    parquet_path = tmp_path / "input.parquet"
+    pq.write_table(table, parquet_path, row_group_size=7)
+    arrow_path = tmp_path / "input.arrow"
+    with pa.OSFile(str(arrow_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=7)
+
+    expected = run_cli(monkeypatch, str(csv_path))
+    rows = list(csv.reader(io.StringIO(expected.decode("utf-8"))))
+    for path in (parquet_path, arrow_path):
+        assert run_cli(monkeypatch, str(path)) == expected
+
+        parquet = run_cli(monkeypatch, str(path), output_format="parquet")
+        output = pq.read_table(pa.BufferReader(parquet))
+        assert output.column_names == rows[0]
+        assert [
+            [v or "" for v in row]
+            for row in arrow.batch_to_rows(output.combine_chunks().to_batches()[0])
+        ] == rows[1:]
+
+    stream = run_cli(monkeypatch, str(csv_path), output_format="arrow")
+    output = pa.ipc.open_stream(stream).read_all()
+    assert output.schema == arrow.string_schema(rows[0])
+    assert output.num_rows == len(rows) - 1
+
+
+def test_arrow_stream_from_stdin(monkeypatch, tmp_path):
+    """Test reading an Arrow IPC stream piped into stdin"""
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, string_table().schema) as writer:
+        writer.write_table(string_table())
+
+    class FakeStdin:
+        buffer = io.BytesIO(sink.getvalue())
+
+    monkeypatch.setattr(cli.sys, "stdin", FakeStdin())
+    output = run_cli(monkeypatch, "-", input_format="arrow")
+    assert output.startswith(b"full_name,dob,phone,note\r\n")
+
+
+def test_unsupported_inputs(monkeypatch, tmp_path):
+    path = tmp_path / "input.parquet"
+    pq.write_table(string_table(), path)
+    with pytest.raises(ValueError):
+        run_cli(monkeypatch, "-", input_format="parquet")
+    with pytest.raises(ValueError):
+        run_cli(monkeypatch, str(path), workers=2)
+    with pytest.raises(ValueError):
+        run_cli(monkeypatch, str(path), output_format="xlsx")
+
+
+def test_without_pyarrow(monkeypatch):
+    monkeypatch.setattr(arrow, "pa", None)
+    with pytest.raises(ImportError, match="pyarrow"):
+        Generator().generate_record_batch(string_table().to_batches()[0])
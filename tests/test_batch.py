@@ -0,0 +1,84 @@
+import random
+from unittest import mock
+import pytest
+from mistaker import Date, Email, Number, vectorized
+from mistaker.alias import AliasTable
+from mistaker.rng import stream
+
+
+def _numbers(rand):
+    values = [
+        f"{rand.randint(100, 999)}-{rand.randint(100, 999)}-{rand.randint(1000, 9999)}"
+        for _ in range(200)
+    ]
+    return values + ["", "abc", "7", "12", "123-45-6789"]
+
+
+def _dates(rand):
+    values = []
+    for _ in range(300):
+        year = rand.choice([rand.randint(1900, 2030), 5, 12, 9995, 9999, 2000])
+        month, day = rand.randint(1, 12), rand.randint(1, 31)
+        values.append(
+            rand.choice(
+                [
+                    f"{year:04d}-{month:02d}-{day:02d}",
+                    f"{month}/{day}/{year:04d}",
+                    f"{month}/{day}/{year % 100:02d}",
+                ]
+            )
+        )
+    return values + ["", "not a date", "2020-1-5"]
+
+
+def _emails(rand):
+    values = ["john.smith@example.com", "a+b@x.co.uk", "", None, "a@b@c", "@x.com"]
+    return values * 10
+
+
+BATCHES = [(Number, _numbers), (Date, _dates), (Email, _emails)]
+
+
+def _as_text(results):
+    return [repr(r) if isinstance(r, Exception) else r for r in results]
+
+
+def _scalar(mistaker, values, rands, counts, error_table):
+    results = []
+    for value, rand, count in zip(values, rands, counts):
+        try:
+            results.append(
+                mistaker(value, rand=rand, error_table=error_table).chaos(count)
+            )
+        except (ValueError, AttributeError) as e:
+            results.append(e)
+    return _as_text(results)
+
+
+@pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "no-numpy"])
+@pytest.mark.parametrize("make_rand", [stream, random.Random], ids=["stream", "random"])
+@pytest.mark.parametrize("weighted", [False, True], ids=["uniform", "weighted"])
+@pytest.mark.parametrize(
+    "mistaker, make_values", BATCHES, ids=[m.__name__ for m, _ in BATCHES]
+)
+def test_mistake_batch_matches_scalar(
+    mistaker, make_values, weighted, make_rand, numpy
+):
+    """Test that mistake_batch gives what chaos() gives one value at a time"""
+    if numpy:
+        pytest.importorskip("numpy")
+    rand = random.Random(0)
+    values = make_values(rand)
+    counts = [rand.randint(0, 8) for _ in values]
+    error_table = None
+    if weighted:
+        error_types = mistaker.error_table.items
+        error_table = AliasTable(error_types, range(1, len(error_types) + 1))
+
+    def rands():
+        return [make_rand(i) for i in range(len(values))]
+
+    expected = _scalar(mistaker, values, rands(), counts, error_table)
+    with mock.patch.object(vectorized, "np", vectorized.np if numpy else None):
+        batch = mistaker.mistake_batch(values, rands(), counts, error_table)
+    assert _as_text(batch) == expected
@@ -0,0 +1,52 @@
+import pytest
+from mistaker.cache import LRUCache
+
+
+def test_get_and_put():
+    cache = LRUCache(maxsize=2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert cache.info().hits == 1
+    assert cache.info().misses == 1
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_get_or_compute():
+    cache = LRUCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_compute("key", compute) == "value"
+    assert cache.get_or_compute("key", compute) == "value"
+    assert len(calls) == 1
+
+
+def test_clear_resets_counters():
+    cache = LRUCache()
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    cache.clear()
+    assert cache.info() == (0, 0, 0, cache.maxsize, 0)
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
@@ -0,0 +1,175 @@
+# tests/test_cli.py
+import csv
+import io
+import subprocess
+import sys
+import pytest
+from mistaker import Generator
+from mistaker import cli
+
+FIELDS = ["full_name", "dob", "phone", "email", "note"]
+RECORDS = [
+    ["John Smith", "1980-01-02", "5551234567", "john.smith@example.com", "a, b"],
+    ["Jane Doe", "12/5/1990", "5559876543", "jane@example.co.uk", "café"],
+    ["Bob Jones", "", "5550001111", "", ""],
+] * 4
+
+
+class FlushCountingBytes(io.BytesIO):
+    """Stand-in for sys.stdout.buffer that remembers what each flush saw"""
+
+    def __init__(self):
+        super().__init__()
+        self.flushed = []
+
+    def flush(self):
+        self.flushed.append(len(self.getvalue()))
+        super().flush()
+
+
+class FakeStdout:
+    def __init__(self):
+        self.buffer = FlushCountingBytes()
+
+
+@pytest.fixture
+def input_csv(tmp_path):
+    path = tmp_path / "input.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        writer.writerows(RECORDS)
+    return str(path)
+
+
+def run_cli(monkeypatch, input_csv, **kwargs):
+    stdout = FakeStdout()
+    monkeypatch.setattr(cli.sys, "stdout", stdout)
+    cli.process_file(Generator(seed=7), input_csv, **kwargs)
+    return stdout.buffer
+
+
+def test_output_is_the_same_in_every_mode(monkeypatch, input_csv):
+    """Test that buffering never changes what is written"""
+    expected = run_cli(monkeypatch, input_csv).getvalue()
+    rows = list(csv.reader(io.StringIO(expected.decode("utf-8"))))
+    assert rows[0] == FIELDS
+    assert len(rows) > len(RECORDS) * 3
+
+    for kwargs in [
+        {"unbuffered": True},
+        {"flush_every": 5},
+        {"chunk_size": 1},
+        {"workers": 2, "chunk_size": 4},
+    ]:
+        assert run_cli(monkeypatch, input_csv, **kwargs).getvalue() == expected
+
+
+def test_worker_start_method_is_chosen_per_call(monkeypatch, input_csv):
+    """Test that the CLI picks a fork server for its own pool only"""
+    multiprocessing = pytest.importorskip("multiprocessing")
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        pytest.skip("No fork server on this platform")
+
+    generator = Generator(seed=7)
+    contexts = []
+    generate_rows = Generator.generate_rows
+
+    def spy(self, *args, **kwargs):
+        contexts.append(kwargs.get("mp_context"))
+        return generate_rows(self, *args, **kwargs)
+
+    monkeypatch.setattr(Generator, "generate_rows", spy)
+    monkeypatch.setattr(cli.sys, "stdout", FakeStdout())
+    cli.process_file(generator, input_csv, workers=2, chunk_size=4)
+    cli.process_file(generator, input_csv, workers=1)
+
+    assert contexts[0].get_start_method() == "forkserver"
+    assert contexts[1] is None
+    assert not hasattr(generator, "mp_context")
+
+
+def test_buffered_output_is_written_at_the_end(monkeypatch, input_csv):
+    """Test that a small output reaches stdout in one write and flush"""
+    output = run_cli(monkeypatch, input_csv)
+    assert output.flushed == [len(output.getvalue())]
+
+
+def test_flush_every(monkeypatch, input_csv):
+    """Test that output is flushed after every flush_every rows"""
+    output = run_cli(monkeypatch, input_csv, flush_every=10, chunk_size=10)
+    rows = output.getvalue().decode("utf-8").count("\r\n") - 1
+    assert len(output.flushed) == rows // 10 + 1
+    assert output.flushed == sorted(set(output.flushed))
+
+
+def test_unbuffered_flushes_each_row(monkeypatch, input_csv):
+    """Test that unbuffered output reaches stdout row by row"""
+    output = run_cli(monkeypatch, input_csv, unbuffered=True)
+    rows = output.getvalue().decode("utf-8").count("\r\n") - 1
+    assert len(output.flushed) >= rows
+
+
+def test_flush_every_must_be_positive(monkeypatch, input_csv):
+    with pytest.raises(ValueError):
+        run_cli(monkeypatch, input_csv, flush_every=0)
+
+
+def test_ragged_rows(monkeypatch, tmp_path):
+    """Test that short rows are padded and blank lines skipped"""
+    path = tmp_path / "ragged.csv"
+    path.write_text("phone,note,extra\n5551234567,a\n\n5559876543,b,c\n")
+    rows = list(
+        csv.reader(io.StringIO(run_cli(monkeypatch, str(path)).getvalue().decode()))
+    )
+    assert rows[0] == ["phone", "note", "extra"]
+    assert ["5551234567", "a", ""] in rows
+    assert ["5559876543", "b", "c"] in rows
+    assert all(len(row) == 3 for row in rows)
+
+
+def test_rows_longer_than_header(monkeypatch, tmp_path):
+    path = tmp_path / "long.csv"
+    path.write_text("phone,note\n5551234567,a,b\n")
+    with pytest.raises(ValueError, match="Line 2"):
+        run_cli(monkeypatch, str(path))
+
+
+def test_reads_open_files_and_line_iterables(monkeypatch, input_csv):
+    """Test that file objects and iterables of lines work like paths"""
+    expected = run_cli(monkeypatch, input_csv).getvalue()
+    with open(input_csv, newline="", encoding="utf-8") as infile:
+        assert run_cli(monkeypatch, infile).getvalue() == expected
+    with open(input_csv, newline="", encoding="utf-8") as infile:
+        lines = iter(infile.readlines())
+    assert run_cli(monkeypatch, lines).getvalue() == expected
+
+
+def test_streams_input_as_it_arrives(monkeypatch):
+    """Test that rows are written before the input stream ends"""
+
+    class StreamCut(Exception):
+        pass
+
+    def stream():
+        yield "phone,note\r\n"
+        for i in range(5):
+            yield f"555000{i:04d},row {i}\r\n"
+        raise StreamCut()
+
+    stdout = FakeStdout()
+    monkeypatch.setattr(cli.sys, "stdout", stdout)
+    with pytest.raises(StreamCut):
+        cli.process_file(Generator(seed=1), stream(), unbuffered=True)
+    assert stdout.buffer.getvalue().decode().count("row 4") > 1
+
+
+def test_main_reads_stdin(input_csv):
+    """Test piping a CSV into the command"""
+    command = [sys.executable, "-m", "mistaker.cli", "--seed", "3"]
+    from_file = subprocess.run(command + [input_csv], capture_output=True)
+    with open(input_csv, "rb") as infile:
+        from_stdin = subprocess.run(command, stdin=infile, capture_output=True)
+    assert from_stdin.returncode == 0, from_stdin.stderr
+    assert from_stdin.stdout == from_file.stdout
+    assert from_stdin.stdout.startswith(b"full_name,dob")
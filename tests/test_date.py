@@ -1,7 +1,10 @@
 # tests/test_date.py
 import pytest
-from mistaker import Date
+import random
+from unittest import mock
+from mistaker import Date, vectorized
 from mistaker.constants import ErrorType
+from mistaker.rng import stream
 
 
 def test_reformat():
@@ -54,6 +57,18 @@ def test_one_decade_down():
     assert date.mistake(ErrorType.ONE_DECADE_DOWN) == "2000-12-05"
 
 
+def test_year_never_goes_negative():
+    """Test that stepping back from a year below ten leaves the year alone"""
+    date = Date("0005-12-05")
+    assert date.mistake(ErrorType.ONE_DECADE_DOWN) == "0005-12-05"
+    date.text = "0000-12-05"
+    assert date.mistake(ErrorType.ONE_DIGIT_DOWN, Date.DatePart.YEAR) == "0000-12-05"
+
+    for i in range(2000):
+        result = Date("2000-05-06", rand=random.Random(i)).chaos(6)
+        assert not result.startswith("-"), result
+
+
 def test_y2k():
     date = Date()
     # Test 21st century date
@@ -130,3 +145,99 @@ def test_numeric_key_pad():
     for input_date, date_part, expected in test_cases:
         date.text = input_date
         assert date.mistake(ErrorType.NUMERIC_KEY_PAD, date_part) == expected
+
+
+def test_chaos_compounds_mistakes():
+    """Test that chaos() stacks mistakes on one parsed date"""
+    date = Date("2010-12-05", rand=random.Random(5))
+    with mock.patch.object(Date, "_parse", wraps=date._parse) as parse:
+        result = date.chaos(5)
+        assert parse.call_count == 1
+
+    assert result != "2010-12-05"
+    assert date.text == "2010-12-05"  # Original text is left alone
+
+
+def test_chaos_handles_short_years():
+    """Test that compounding through digit shifts never breaks on short years"""
+    date = Date()
+    date.text = "1982-09-04"
+    shifted = date.mistake(ErrorType.DIGIT_SHIFT)
+    assert shifted == "0019-82-09"
+
+    date.text = shifted
+    for error_type in [ErrorType.MISREAD, ErrorType.NUMERIC_KEY_PAD, ErrorType.Y2K]:
+        assert date.mistake(error_type, Date.DatePart.YEAR)
+
+
+@pytest.mark.parametrize("error_type", Date.ERROR_TYPES)
+def test_date_kernel_each_error(error_type):
+    """Test each vectorized error type and date part against _apply_mistake"""
+    np = pytest.importorskip("numpy")
+    dates = [(1987, 4, 29), (2003, 12, 1), (40, 10, 9), (9999, 31, 12), (5, 1, 2)] * 8
+    codes = np.full((len(dates), 1), vectorized._DATE_CODES[error_type])
+    date = Date()
+    for part in Date.DATE_PARTS:
+        parts = np.full((len(dates), 1), part)
+        texts, escaped = vectorized.date_mistakes(dates, codes, parts)
+        for row, text in enumerate(texts):
+            expected = date._join_date(
+                *date._apply_mistake(*dates[row], error_type, part)
+            )
+            if row in escaped:
+                assert date._join_date(*escaped[row][1]) == expected
+            else:
+                assert text == expected
+
+
+def test_mistake_batch_finishes_years_past_9999():
+    """Test that rows whose year passes 9999 are finished one at a time"""
+    pytest.importorskip("numpy")
+    values = ["9999-12-31"] * 100
+    date_mistakes = vectorized.date_mistakes
+    escaped = {}
+
+    def spy(*args):
+        texts, rows = date_mistakes(*args)
+        escaped.update(rows)
+        return texts, rows
+
+    rands = [stream(0, i) for i in range(len(values))]
+    with mock.patch.object(vectorized, "date_mistakes", spy):
+        batch = Date.mistake_batch(values, rands, [6] * len(values))
+    assert escaped
+    assert batch == [
+        Date(value, rand=stream(0, i)).chaos(6) for i, value in enumerate(values)
+    ]
+
+
+def test_known_formats_skip_regex_parsing():
+    """Test that ISO and M/D/Y dates are parsed without reformat()"""
+    with mock.patch.object(Date, "reformat") as reformat:
+        assert Date("2010-12-05")._parse() == ("2010-12-05", (2010, 12, 5))
+        assert Date("1/2/1999")._parse() == ("1999-01-02", (1999, 1, 2))
+        assert Date("1/2/99")._parse() == ("2099-01-02", (2099, 1, 2))
+        assert not reformat.called
+
+    # Anything else still goes through reformat()
+    assert Date("2010-1-5")._parse() == ("2010-01-05", (2010, 1, 5))
+
+
+def test_repeated_mistakes_skip_parsing():
+    """Test that a mistake made on the previous mistake reuses its parse"""
+    date = Date("2010-12-05", rand=random.Random(2))
+    date.text = date.mistake()
+    parse_iso = mock.Mock(return_value=None)
+    with mock.patch.dict(Date.FORMAT_PARSERS, {"iso": parse_iso}):
+        date.text = date.mistake()
+        assert not parse_iso.called
+        date.text = "2010-12-05"
+        date.mistake()
+        assert parse_iso.called
+
+
+def test_detect_format():
+    """Test that the format most of a column uses is detected"""
+    assert Date.detect_format(["2010-12-05", "1999-01-02", "1/2/99"]) == "iso"
+    assert Date.detect_format(["12/5/2010", "1/2/99", None, ""]) == "mdy"
+    assert Date.detect_format(["not a date", ""]) is None
@@ -0,0 +1,127 @@
+# tests/test_date_table.py
+import pickle
+import random
+from unittest import mock
+from datetime import date
+import pytest
+from mistaker import Date, Generator
+from mistaker.date_table import DateTable, StaleTableError
+
+FIRST = date(1999, 12, 20)
+LAST = date(2000, 3, 1)
+
+
+@pytest.fixture
+def table():
+    return DateTable.build(FIRST, LAST)
+
+
+@pytest.fixture
+def table_path(tmp_path, table):
+    path = str(tmp_path / "dates.bin")
+    table.save(path)
+    return path
+
+
+def test_lookup_matches_apply_mistake(table):
+    mistaker = Date()
+    for ordinal in range(FIRST.toordinal(), LAST.toordinal() + 1):
+        day = date.fromordinal(ordinal)
+        for error_type in Date.ERROR_TYPES:
+            for part in Date.DATE_PARTS:
+                expected = mistaker._apply_mistake(
+                    day.year, day.month, day.day, error_type, part
+                )
+                assert (
+                    table.lookup(day.year, day.month, day.day, error_type, part)
+                    == expected
+                )
+
+
+def test_lookup_outside_table(table):
+    error_type = Date.ERROR_TYPES[0]
+    assert table.lookup(1999, 12, 19, error_type, 0) is None
+    assert table.lookup(2000, 2, 30, error_type, 0) is None
+    assert table.lookup(2000, 13, 1, error_type, 0) is None
+
+
+def test_save_and_load(table, table_path):
+    loaded = DateTable.load(table_path)
+    assert list(loaded.values) == list(table.values)
+    assert (loaded.first, loaded.days) == (table.first, table.days)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a date table at all")
+    with pytest.raises(ValueError):
+        DateTable.load(str(path))
+
+
+def test_load_rejects_stale_tables(table_path):
+    with mock.patch.object(Date, "MISTAKE_VERSION", Date.MISTAKE_VERSION + 1):
+        with pytest.raises(StaleTableError, match="mistake logic"):
+            DateTable.load(table_path)
+
+    with open(table_path, "r+b") as f:
+        f.write(b"MSTKDT01")
+    with pytest.raises(StaleTableError, match="older"):
+        DateTable.load(table_path)
+
+
+def test_load_or_build_rebuilds_stale_tables(table, table_path):
+    with mock.patch.object(Date, "MISTAKE_VERSION", Date.MISTAKE_VERSION + 1):
+        with mock.patch.object(DateTable, "build", return_value=table) as build:
+            loaded = DateTable.load_or_build(table_path)
+        assert build.call_count == 1
+        assert list(loaded.values) == list(table.values)
+        assert DateTable.load(table_path).path == table_path
+
+
+def test_pickles_as_path(table_path):
+    loaded = DateTable.load(table_path)
+    unpickled = pickle.loads(pickle.dumps(loaded))
+    assert unpickled.path == table_path
+    assert list(unpickled.values) == list(loaded.values)
+
+
+def test_table_gives_same_mistakes(table):
+    values = ["2000-01-01", "1999-12-31", "2000-02-29", "1987-04-29"] * 20
+
+    def run(date_table):
+        return [
+            Date(value, rand=random.Random(i), date_table=date_table).chaos(4)
+            for i, value in enumerate(values)
+        ]
+
+    assert run(table) == run(None)
+    assert Date.date_table is None
+
+
+def test_generator_loads_table_from_config(table_path):
+    generator = Generator(config={"date_table": table_path})
+    assert generator.date_table.path == table_path
+    step = generator.compile_plan(["dob"]).steps[0]
+    assert step.options["date_table"] is generator.date_table
+    assert Date.date_table is None
+
+
+def test_generator_tables_are_separate(table_path):
+    generator = Generator(config={"date_table": table_path})
+    assert "date_table" not in Generator().compile_plan(["dob"]).steps[0].options
+
+    del generator.config["date_table"]
+    generator.validate_config()
+    assert generator.date_table is None
+    assert "date_table" not in generator.compile_plan(["dob"]).steps[0].options
+
+
+def test_generator_uses_its_table(table, table_path):
+    rows = [["2000-01-01"], ["1999-12-31"], ["2000-02-29"]] * 10
+    expected = list(Generator(seed=4).generate_rows(rows, ["dob"]))
+    generator = Generator(seed=4, config={"date_table": table_path})
+    with mock.patch.object(
+        DateTable, "lookup", autospec=True, side_effect=DateTable.lookup
+    ) as lookup:
+        assert list(generator.generate_rows(rows, ["dob"])) == expected
+    assert lookup.called
@@ -1,4 +1,5 @@
 import pytest
+import random
 from mistaker import Email
 from mistaker.constants import ErrorType
 
@@ -205,3 +206,33 @@ def test_complex_email_splitting():
             assert mistakes_found[
                 part
             ], f"No mistakes were found for part '{part}' in {input_email}"
+
+
+def test_chaos_compounds_mistakes():
+    """Test that chaos() makes several word mistakes in one rebuilt email"""
+    email = Email("john.smith@example.com", rand=random.Random(2))
+    result = email.chaos(3)
+    assert result != "john.smith@example.com"
+    assert "@" in result
+    assert result.endswith(".com")
+    assert email.text == "john.smith@example.com"
+
+
+def test_split_is_cached():
+    """Test that each address is split once and shared between instances"""
+    Email.split_cache.clear()
+    parts = Email()._split_email_parts("first.last+spam@some.corp.co.uk")
+    assert parts == (
+        (("first", "."), ("last", "+"), ("spam", "")),
+        (("some", "."), ("corp", ".")),
+        "co.uk",
+    )
+    assert Email()._split_email_parts("first.last+spam@some.corp.co.uk") is parts
+    assert Email.cache_info().hits == 1
+    assert Email.cache_info().misses == 1
+
+
+def test_split_drops_extra_delimiters():
+    """Test that leading and repeated prefix delimiters are dropped"""
+    prefix_parts, _, _ = Email()._split_email_parts("_a..b_@x.com")
+    assert prefix_parts == (("a", "."), ("b", "_"))
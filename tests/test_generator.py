@@ -1,5 +1,5 @@
 import pytest
-from mistaker import Generator
+from mistaker import Generator, Number
 
 
 def test_generator_defaults():
@@ -43,6 +43,24 @@ def test_invalid_config():
     with pytest.raises(ValueError):
         Generator(config={"missing_weights": {"full_name": 1.5}})
 
+    # Test invalid mistake weight
+    with pytest.raises(ValueError):
+        Generator(config={"mistake_weights": {"full_name": -0.1}})
+
+    # Test unknown error type, negative and all-zero error weights
+    with pytest.raises(ValueError):
+        Generator(config={"error_weights": {"dob": {"DROPPED_LETTER": 1}}})
+    with pytest.raises(ValueError):
+        Generator(config={"error_weights": {"phone": {"MISREAD": -1}}})
+    with pytest.raises(ValueError):
+        Generator(
+            config={"error_weights": {"ssn": {t.name: 0 for t in Number.ERROR_TYPES}}}
+        )
+
+    # Test error weights on a field that does not draw error types
+    with pytest.raises(ValueError):
+        Generator(config={"error_weights": {"full_name": {"DROPPED_LETTER": 1}}})
+
 
 def test_generate_single_record():
     """Test generation of variations for a single record"""
@@ -122,3 +140,186 @@ def test_from_file_missing():
     """Test graceful handling of missing config file"""
     generator = Generator.from_file("nonexistent.json")
     assert isinstance(generator, Generator)  # Should create with defaults
+
+
+def test_generate_all_parallel_preserves_order():
+    """Test that the process pool yields records in input order"""
+    generator = Generator(min_duplicates=1, max_duplicates=1)
+    records = [{"full_name": f"Person {i}", "phone": f"555-{i:04d}"} for i in range(7)]
+
+    results = list(generator.generate_all(records, workers=2, chunk_size=2))
+    assert len(results) == 14  # (Original + 1 duplicate) * 7 records
+    assert results[::2] == records  # Originals stay in input order
+
+
+def test_generate_all_invalid_workers():
+    """Test that invalid parallel settings are rejected"""
+    generator = Generator()
+    with pytest.raises(ValueError):
+        list(generator.generate_all([{}], workers=0))
+    with pytest.raises(ValueError):
+        list(generator.generate_all([{}], chunk_size=0))
+
+
+SEEDED_RECORDS = [
+    {
+        "full_name": "William James Smith",
+        "dob": "1980-04-12",
+        "phone": "555-123-4567",
+        "email": "will.smith@example.com",
+        "ssn": "123-45-6789",
+        "dl_num": "AB123CD456",
+        "full_address": "123 N Main St Apt 4B Denver, CO 80202",
+    },
+    {
+        "full_name": "Jane Doe",
+        "dob": "03/15/1992",
+        "phone": "555-987-6543",
+        "email": "jdoe@example.org",
+        "ssn": "987-65-4321",
+        "dl_num": "X9876543",
+        "full_address": "456 East Washington Avenue, Portland, OR 97232",
+    },
+]
+
+
+def test_seeded_generate_all_is_reproducible():
+    """Test that two generators with the same seed produce identical output"""
+    first = list(Generator(seed=42).generate_all(SEEDED_RECORDS * 3))
+    second = list(Generator(seed=42).generate_all(SEEDED_RECORDS * 3))
+    assert first == second
+
+    different = list(Generator(seed=43).generate_all(SEEDED_RECORDS * 3))
+    assert first != different
+
+
+def test_seeded_slice_matches_full_run():
+    """Test that a slice of the input regenerates without replaying earlier rows"""
+    records = SEEDED_RECORDS * 3
+    full = list(Generator(seed=7).generate_all(records))
+
+    tail = list(Generator(seed=7).generate_all(records[4:], start=4))
+    assert full[-len(tail) :] == tail
+
+
+def test_seeded_parallel_matches_serial():
+    """Test that parallel output matches single-process output for a seed"""
+    records = SEEDED_RECORDS * 5
+    serial = list(Generator(seed=99).generate_all(records))
+    parallel = list(Generator(seed=99).generate_all(records, workers=2, chunk_size=3))
+    assert serial == parallel
+
+
+def test_seed_from_config():
+    """Test that the seed can be supplied through the config"""
+    generator = Generator(config={"seed": 5})
+    assert generator.seed == 5
+
+
+def test_error_weights_compiled_at_load():
+    """Test that error weights become one alias table per configured field"""
+    generator = Generator(config={"error_weights": {"dob": {"Y2K": 4, "MISREAD": 0}}})
+    assert set(generator.error_tables) == {"dob"}
+    table = generator.error_tables["dob"]
+    weights = dict(zip((t.name for t in table.items), table.weights))
+    assert weights["Y2K"] == 4
+    assert weights["MISREAD"] == 0
+    assert weights["KEY_SWAP"] == 1.0
+
+
+def test_generate_batch_matches_generate_all():
+    """Test that the columnar batch gives the same rows as generate_all"""
+    records = SEEDED_RECORDS * 3
+    expected = list(Generator(seed=11).generate_all(records))
+
+    columns = {field: [r[field] for r in records] for field in records[0]}
+    output, cluster_ids = Generator(seed=11).generate_batch(columns)
+    rows = [dict(zip(output, values)) for values in zip(*output.values())]
+    assert rows == expected
+    assert len(cluster_ids) == len(rows)
+    assert sorted(set(cluster_ids)) == list(range(len(records)))
+    assert cluster_ids == sorted(cluster_ids)
+
+
+def test_generate_batch_continues_index():
+    """Test that consecutive batches use consecutive record positions"""
+    records = SEEDED_RECORDS * 2
+    columns = {field: [r[field] for r in records] for field in records[0]}
+    head = {field: values[:2] for field, values in columns.items()}
+    tail = {field: values[2:] for field, values in columns.items()}
+
+    full, full_ids = Generator(seed=3).generate_batch(columns)
+    generator = Generator(seed=3)
+    first, first_ids = generator.generate_batch(head)
+    second, second_ids = generator.generate_batch(tail)
+    assert first_ids + second_ids == full_ids
+    assert {f: first[f] + second[f] for f in full} == full
+
+
+def test_generate_batch_numpy_columns():
+    """Test that NumPy object arrays are accepted as columns"""
+    np = pytest.importorskip("numpy")
+    columns = {
+        "full_name": ["John Smith", "Jane Doe"],
+        "phone": ["555-1234", "555-9876"],
+    }
+    arrays = {
+        field: np.array(values, dtype=object) for field, values in columns.items()
+    }
+    assert Generator(seed=5).generate_batch(arrays) == Generator(seed=5).generate_batch(
+        columns
+    )
+
+
+def test_generate_batch_unequal_columns():
+    """Test that columns of different lengths are rejected"""
+    with pytest.raises(ValueError):
+        Generator().generate_batch({"full_name": ["John Smith"], "phone": []})
+
+
+def test_generate_rows_matches_generate_all():
+    """Test that rows of values give the same output as dict records"""
+    records = SEEDED_RECORDS * 3
+    fieldnames = list(records[0]) + ["notes"]
+    records = [dict(record, notes=f"note {i}") for i, record in enumerate(records)]
+    expected = [list(r.values()) for r in Generator(seed=5).generate_all(records)]
+
+    rows = [list(record.values()) for record in records]
+    assert list(Generator(seed=5).generate_rows(rows, fieldnames)) == expected
+    parallel = Generator(seed=5).generate_rows(
+        rows, fieldnames, workers=2, chunk_size=2
+    )
+    assert list(parallel) == expected
+
+
+def test_generate_rows_shares_untouched_values():
+    """Test that duplicates reuse the original row's unmutated values"""
+    fieldnames = ["phone", "notes"]
+    row = ["555-123-4567", "".join(["long ", "note"])]
+    output = list(Generator(seed=1).generate_rows([row], fieldnames))
+    assert output[0] is row
+    for duplicate in output[1:]:
+        assert duplicate is not row
+        assert duplicate[1] is row[1]
+
+
+def test_consecutive_generate_all_calls_continue_index():
+    """Test that a second call draws from fresh streams, not the first's"""
+    records = SEEDED_RECORDS * 2
+    generator = Generator(seed=6)
+    first = list(generator.generate_all(records))
+    second = list(generator.generate_all(records))
+    assert first != second
+    assert second == list(Generator(seed=6).generate_all(records, start=4))
+
+    parallel = Generator(seed=6)
+    list(parallel.generate_all(records, workers=2, chunk_size=1))
+    assert list(parallel.generate_all(records)) == second
+
+    rows = [list(record.values()) for record in records]
+    generator = Generator(seed=6)
+    list(generator.generate_rows(rows, list(records[0])))
+    assert [
+        dict(zip(records[0], row))
+        for row in generator.generate_rows(rows, list(records[0]))
+    ] == second
@@ -63,3 +63,31 @@ class TestLicenseNumber:
         result = license_num.mistake()
         assert result != "123"
         assert result.isdigit()
+
+    def test_segments_are_cached(self):
+        """Test that each license number is segmented once"""
+        LicenseNumber.segment_cache.clear()
+        segments = LicenseNumber()._segments("D123-456X")
+        assert segments == ("D", "123", "-", "456", "X")
+        assert LicenseNumber()._segments("D123-456X") is segments
+        assert LicenseNumber.cache_info().hits == 1
+
+    def test_shares_one_number_mistaker(self):
+        """Test that digit runs are mistaken without building Number objects"""
+        license_num = LicenseNumber("AB123CD456EF789")
+        with mock.patch("mistaker.license_number.Number") as number_class:
+            license_num.chaos(3)
+            assert not number_class.called
+
+    def test_chaos_matches_compounded_mistakes(self):
+        """Test that chaos() segments once but compounds like mistake()"""
+        for seed in range(20):
+            license_num = LicenseNumber("D123-456-789X", rand=random.Random(seed))
+            expected = "D123-456-789X"
+            for _ in range(4):
+                license_num.text = expected
+                expected = license_num.mistake()
+
+            license_num = LicenseNumber("D123-456-789X", rand=random.Random(seed))
+            assert license_num.chaos(4) == expected
+            assert license_num.text == "D123-456-789X"
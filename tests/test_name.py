@@ -1,5 +1,9 @@
+import re
 import pytest
+import random
+from unittest import mock
 from mistaker import Name
+from mistaker.alias import AliasTable
 from mistaker.constants import ErrorType
 
 
@@ -191,3 +195,103 @@ def test_name_variations_with_prefix_suffix():
     assert has_prefix, "Should include prefix in some variations"
     assert has_suffix, "Should include suffix in some variations"
     assert has_middle, "Should include middle name in some variations"
+
+
+def test_nickname_index_loaded_once():
+    """Test that nickname tables are loaded once and shared by all names"""
+    nicknames = pytest.importorskip("nicknames")
+    Name._nickname_index = None
+    with mock.patch("nicknames.NickNamer", wraps=nicknames.NickNamer) as namer:
+        Name("William Smith").get_name_variations()
+        Name("Robert Jones").get_name_variations()
+        assert namer.call_count == 1
+
+    index = Name.nickname_index()
+    assert "WILLIAM" in index
+    assert "bill" in index["WILLIAM"]
+    assert Name()._get_nickname_variations(" william ") == list(index["WILLIAM"])
+
+
+def test_name_variations_are_cached():
+    """Test that variations are built once per distinct name"""
+    Name.variations_cache.clear()
+    with mock.patch.object(
+        Name, "_build_variations", autospec=True, return_value=("A", "B")
+    ) as build:
+        assert Name("John Smith").get_name_variations() == ["A", "B"]
+        assert Name(" John   Smith ").get_name_variations() == ["A", "B"]
+        assert build.call_count == 1
+
+    assert Name.variations_cache.info().hits == 1
+
+
+def test_name_variations_stable_order():
+    """Test that variations come back in the same order every time"""
+    Name.variations_cache.clear()
+    first = Name("Dr William James Smith Jr").get_name_variations()
+    Name.variations_cache.clear()
+    second = Name("Dr William James Smith Jr").get_name_variations()
+    assert first == second
+
+    # Callers get their own list; the cached tuple is unaffected
+    first.clear()
+    assert Name("Dr William James Smith Jr").get_name_variations() == second
+
+
+def test_sample_variation_without_full_list():
+    """Test that sampling picks a real variation without enumerating them all"""
+    name = Name("Dr William James Smith Jr")
+    variations = set(name.get_name_variations())
+
+    with mock.patch.object(Name, "_build_variations") as build:
+        samples = {name.sample_variation() for _ in range(200)}
+        assert not build.called
+
+    assert samples <= variations
+    assert len(samples) > 10
+
+
+def test_sample_variation_is_uniform():
+    """Test that each distinct variation is about equally likely"""
+    import random
+    from collections import Counter
+
+    name = Name("John A Smith", rand=random.Random(7))
+    variations = name.get_name_variations()
+    counts = Counter(name.sample_variation() for _ in range(200 * len(variations)))
+
+    assert set(counts) == set(variations)
+    # Shared initials and the repeated middle-initial template used to give
+    # "j A Smith" several times its share
+    assert max(counts.values()) < 300
+    assert min(counts.values()) > 120
+
+
+def test_sample_variation_is_seeded():
+    """Test that sampling only draws from the instance RNG"""
+    import random
+
+    first = [Name("William Smith", rand=random.Random(3)).mistake() for _ in range(5)]
+    second = [Name("William Smith", rand=random.Random(3)).mistake() for _ in range(5)]
+    assert first == second
+
+
+@pytest.mark.parametrize("count", [3, 4, 6])
+def test_chaos_keeps_the_last_name(count):
+    """Test that chaos draws one variation and then only makes letter edits"""
+    name = Name(
+        "Santiago Maria Cruz", error_table=AliasTable([ErrorType.DOUBLE_LETTER])
+    )
+    variations = {v.upper() for v in name.get_name_variations()}
+
+    for seed in range(100):
+        name.rand = random.Random(seed)
+        with mock.patch.object(
+            Name, "sample_variation", autospec=True, side_effect=Name.sample_variation
+        ) as sample_variation:
+            result = name.chaos(count)
+        assert sample_variation.call_count == 1
+        # Undoing the doubled letters gives back a single variation
+        undone = re.sub(r"(.)\1+", r"\1", result).split()
+        assert " ".join(undone) in variations
+        assert "CRUZ" in undone
@@ -1,6 +1,8 @@
+from unittest import mock
 import pytest
-from mistaker import Number
+from mistaker import Number, vectorized
 from mistaker.constants import ErrorType
+from mistaker.rng import stream
 
 
 def test_reformat():
@@ -133,3 +135,33 @@ def test_invalid_input_types(invalid_input):
     result = number.mistake()
     assert isinstance(result, str)
     assert result == "" or result.isdigit()
+
+
+@pytest.mark.parametrize("error_type", Number.ERROR_TYPES)
+def test_number_kernel_each_error(error_type):
+    """Test each vectorized error type against Number.mistake at every index"""
+    np = pytest.importorskip("numpy")
+    texts = ["0123456789", "9876543210", "5555500000"]
+    codes = np.full((len(texts), 1), vectorized._NUMBER_CODES[error_type])
+    for index in range(10):
+        indexes = np.full((len(texts), 1), index)
+        expected = [Number(text).mistake(error_type, index) for text in texts]
+        assert vectorized.digit_mistakes(texts, codes, indexes) == expected
+
+
+def test_mistake_batch_groups_by_length():
+    """Test that each length large enough gets its own digit matrix"""
+    pytest.importorskip("numpy")
+    values = ["123456789"] * 40 + ["1234"] * vectorized.MIN_BATCH + ["1234567"] * 3
+    rands = [stream(0, i) for i in range(len(values))]
+    counts = [3] * len(values)
+    with mock.patch.object(
+        vectorized, "number_mistakes", wraps=vectorized.number_mistakes
+    ) as number_mistakes:
+        batch = Number.mistake_batch(values, rands, counts)
+    lengths = sorted(len(call.args[0][0]) for call in number_mistakes.call_args_list)
+    assert lengths == [4, 9]
+    expected = [
+        Number(value, rand=stream(0, i)).chaos(3) for i, value in enumerate(values)
+    ]
+    assert batch == expected
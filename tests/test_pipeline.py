@@ -0,0 +1,80 @@
+# tests/test_pipeline.py
+import threading
+import time
+import pytest
+from mistaker.pipeline import ThreadedWriter, read_ahead
+
+
+def test_read_ahead_chunks_in_order():
+    chunks = list(read_ahead(range(10), 4))
+    assert chunks == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert list(read_ahead([], 4)) == []
+
+
+def test_read_ahead_is_bounded():
+    """Test that the reader waits for a slow consumer"""
+    consumed = []
+
+    def items():
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    chunks = read_ahead(items(), 10, depth=2)
+    assert next(chunks) == list(range(10))
+    time.sleep(0.3)
+    # The chunk handed over, two queued and one waiting to be queued
+    assert len(consumed) <= 40
+    chunks.close()
+
+
+def test_read_ahead_raises_reader_errors():
+    def items():
+        yield 1
+        raise ValueError("bad row")
+
+    with pytest.raises(ValueError, match="bad row"):
+        list(read_ahead(items(), 1))
+
+
+def test_read_ahead_close_stops_reader():
+    """Test that abandoning the chunks stops the reader thread"""
+    chunks = read_ahead(iter(int, 1), 5, depth=1)  # never ends
+    next(chunks)
+    chunks.close()
+    assert not any(t.name == "mistaker-reader" for t in threading.enumerate())
+
+
+def test_threaded_writer_writes_in_order():
+    written = []
+    with ThreadedWriter(written.extend, depth=1) as writer:
+        for i in range(0, 100, 10):
+            writer.put(list(range(i, i + 10)))
+    assert written == list(range(100))
+
+
+def test_threaded_writer_raises_write_errors():
+    def write(chunk):
+        raise BrokenPipeError()
+
+    writer = ThreadedWriter(write, depth=1)
+    with pytest.raises(BrokenPipeError):
+        for _ in range(100):
+            writer.put([1])
+        writer.close()
+
+
+def test_threaded_writer_abort_drops_queued_chunks():
+    """Test that leaving the block with an error does not wait for output"""
+    written = []
+
+    def write(chunk):
+        time.sleep(0.1)
+        written.extend(chunk)
+
+    with pytest.raises(KeyError):
+        with ThreadedWriter(write, depth=4) as writer:
+            for i in range(4):
+                writer.put([i])
+            raise KeyError()
+    assert len(written) <= 1
@@ -0,0 +1,163 @@
+from unittest import mock
+from mistaker import Date, ErrorType, Generator, Name, Number
+from mistaker.plan import MistakePlan
+
+
+def make_plan(fieldnames, **config):
+    generator = Generator(config=config or None)
+    return generator.compile_plan(fieldnames)
+
+
+def test_plan_only_has_supported_columns():
+    """Test that unsupported columns are resolved away at compile time"""
+    plan = make_plan(["id", "full_name", "notes", "phone"])
+    assert [(s.index, s.field) for s in plan.steps] == [(1, "full_name"), (3, "phone")]
+    assert plan.steps[0].mistaker is Name
+    assert plan.steps[1].mistaker is Number
+
+
+def test_plan_resolves_config():
+    """Test that weights and chaos range are copied into the steps"""
+    plan = make_plan(
+        ["phone"], missing_weights={"phone": 0.3}, min_chaos=2, max_chaos=4
+    )
+    step = plan.steps[0]
+    assert step.missing_weight == 0.3
+    assert (step.min_chaos, step.max_chaos) == (2, 4)
+
+
+def test_apply_blanks_missing_and_empty_values():
+    """Test that missing and empty values come out blank"""
+    plan = make_plan(["id", "full_name", "phone"], missing_weights={"full_name": 1.0})
+    row = plan.apply(["7", "John Smith", ""], seed=1, index=0, duplicate=1)
+    assert row == ["7", "", ""]
+
+
+def test_apply_is_deterministic():
+    """Test that the same seed and position give the same row"""
+    plan = make_plan(["full_name", "phone"], missing_weights={"phone": 0.0})
+    first = plan.apply(["John Smith", "555-1234"], seed=3, index=5, duplicate=2)
+    second = plan.apply(["John Smith", "555-1234"], seed=3, index=5, duplicate=2)
+    assert first == second
+
+
+def test_generator_reuses_plans():
+    """Test that a plan is compiled once per header"""
+    generator = Generator()
+    with mock.patch("mistaker.generator.MistakePlan", wraps=MistakePlan) as compile:
+        generator.generate({"full_name": "John Smith", "phone": "555-1234"})
+        generator.generate({"full_name": "Jane Doe", "phone": "555-5678"})
+        assert compile.call_count == 1
+
+
+def test_validate_config_drops_stale_plans():
+    """Test that changing the config recompiles plans"""
+    generator = Generator()
+    plan = generator.compile_plan(["phone"])
+    generator.config["missing_weights"]["phone"] = 1.0
+    generator.validate_config()
+    assert generator.compile_plan(["phone"]) is not plan
+    assert generator.compile_plan(["phone"]).steps[0].missing_weight == 1.0
+
+
+def test_zero_mistake_weight_skips_mistaker():
+    """Test that fields chosen not to mutate never build a mistaker"""
+    generator = Generator(
+        config={
+            "missing_weights": {"full_address": 0.0},
+            "mistake_weights": {"full_address": 0.0},
+        }
+    )
+    plan = generator.compile_plan(["full_address"])
+    with mock.patch.object(plan.steps[0].mistaker, "chaos") as chaos:
+        row = plan.apply(["123 Main St"], seed=1, index=0, duplicate=1)
+        assert not chaos.called
+    assert row == ["123 Main St"]
+
+
+def test_mistake_weight_is_a_probability():
+    """Test that roughly mistake_weight of the values are mutated"""
+    plan = make_plan(
+        ["phone"], missing_weights={"phone": 0.0}, mistake_weights={"phone": 0.2}
+    )
+    changed = sum(
+        plan.apply(["555-123-4567"], seed=9, index=i, duplicate=1)[0] != "555-123-4567"
+        for i in range(1000)
+    )
+    assert 120 < changed < 280
+
+
+def test_plan_binds_error_tables():
+    """Test that configured error weights reach the field's mistaker"""
+    plan = make_plan(["dob", "phone"], error_weights={"dob": {"MONTH_DAY_SWAP": 5}})
+    dob, phone = plan.steps
+    assert phone.mistaker is Number
+    assert phone.error_table is None
+    table = dob.error_table
+    assert table.weights[table.items.index(ErrorType.MONTH_DAY_SWAP)] == 5
+
+
+def test_apply_uses_error_weights():
+    """Test that a field weighted to one error type only makes that error"""
+    weights = {name: 0 for name in (t.name for t in Date.ERROR_TYPES)}
+    weights["MONTH_DAY_SWAP"] = 1
+    plan = make_plan(
+        ["dob"],
+        missing_weights={"dob": 0.0},
+        error_weights={"dob": weights},
+        min_chaos=1,
+        max_chaos=1,
+    )
+    for index in range(20):
+        assert plan.apply(["2000-03-04"], seed=1, index=index, duplicate=1) == [
+            "2000-04-03"
+        ]
+
+
+def test_apply_column_matches_apply():
+    """Test that column-at-a-time mistakes equal row-at-a-time ones"""
+    plan = make_plan(["full_name", "phone"], missing_weights={"phone": 0.2})
+    rows = [["John Smith", "555-1234"], ["Jane Doe", ""], ["Bob Jones", "555-9876"]]
+    indexes = [0, 0, 1, 1, 2, 2]
+    duplicates = [0, 1, 0, 1, 0, 2]
+    expected = [
+        list(rows[i]) if d == 0 else plan.apply(list(rows[i]), 9, i, d)
+        for i, d in zip(indexes, duplicates)
+    ]
+
+    columns = [
+        plan.apply_column(
+            step, [rows[i][step.index] for i in indexes], 9, indexes, duplicates
+        )
+        for step in plan.steps
+    ]
+    assert [list(row) for row in zip(*columns)] == expected
+
+
+def test_apply_column_keeps_values_that_fail():
+    """Test that a value whose mistaker raises is kept and reported"""
+    plan = make_plan(["full_name"], missing_weights={"full_name": 0.0})
+    with mock.patch.object(Name, "chaos", side_effect=ValueError("bad")):
+        column = plan.apply_column(plan.steps[0], ["John Smith"], 1, [0], [1])
+    assert column == ["John Smith"]
+
+
+def test_plan_detects_date_formats():
+    """Test that a date column's format is detected once and used by apply()"""
+    generator = Generator(config={"missing_weights": {"dob": 0.0}})
+    plan = generator.compile_plan(["id", "dob"], [["1", "1/2/1990"], ["2", ""]])
+    assert plan.steps[0].options == {"date_format": "mdy"}
+    assert generator.compile_plan(["phone"], [["555-1234"]]).steps[0].options == {}
+
+    parse_iso = mock.Mock(return_value=None)
+    with mock.patch.dict(Date.FORMAT_PARSERS, {"iso": parse_iso}):
+        plan.apply(["1", "12/25/1985"], seed=1, index=0, duplicate=1)
+    assert not parse_iso.called
+
+
+def test_generate_rows_samples_date_formats():
+    """Test that generate_rows compiles its plan from the input's first rows"""
+    generator = Generator(seed=1)
+    rows = [["3/4/1990"], ["12/25/1985"]]
+    list(generator.generate_rows(iter(rows), ["dob"]))
+    assert generator.compile_plan(["dob"]).steps[0].options == {"date_format": "mdy"}
@@ -0,0 +1,23 @@
+from mistaker.translate import CharTable, DIGIT_CHARS, NAME_CHARS, WORD_CHARS
+
+
+def test_tables_match_character_filters():
+    text = "Jöhn O'Brien, Jr.\t42 ٣ ß"
+    assert text.upper().translate(WORD_CHARS) == "".join(
+        c for c in text.upper() if c.isalpha() or c.isspace()
+    )
+    assert text.translate(DIGIT_CHARS) == "".join(c for c in text if c.isdigit())
+    assert "SMITH, JOHN".translate(NAME_CHARS) == "SMITH  JOHN"
+
+
+def test_table_decides_each_character_once():
+    calls = []
+
+    def keep_vowels(c):
+        calls.append(c)
+        return c if c in "aeiou" else None
+
+    table = CharTable(keep_vowels)
+    assert "banana".translate(table) == "aaa"
+    assert "banana".translate(table) == "aaa"
+    assert sorted(calls) == ["a", "b", "n"]
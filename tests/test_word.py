@@ -1,3 +1,5 @@
+import random
+from unittest import mock
 import pytest
 from mistaker import Word
 from mistaker.constants import ErrorType
@@ -115,3 +117,11 @@ def test_invalid_input_types(invalid_input):
     word = Word(invalid_input)
     result = word.mistake()
     assert isinstance(result, str)
+
+
+def test_chaos_reformats_once():
+    """Test that compounding mistakes reuse the already-reformatted text"""
+    word = Word("hello world", rand=random.Random(1))
+    with mock.patch.object(Word, "reformat", wraps=word.reformat) as reformat:
+        word.chaos(5)
+    assert reformat.call_count == 1